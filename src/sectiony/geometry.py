@@ -1,9 +1,16 @@
 from __future__ import annotations
-from dataclasses import dataclass, field
-from typing import List, Tuple, Union, Dict, Any, TYPE_CHECKING
+from dataclasses import dataclass, field, replace
+from typing import List, Tuple, Union, Dict, Any, Optional, TYPE_CHECKING
+from functools import lru_cache, cached_property
 import math
 import json
 import warnings
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
 
 # Schema version for JSON serialization
 _SCHEMA_VERSION = 1
@@ -12,12 +19,126 @@ _SCHEMA_VERSION = 1
 Point = Tuple[float, float]
 
 
-@dataclass
+def _sincos(angle: float) -> Tuple[float, float]:
+    """Return (sin, cos) of an angle, evaluated once for reuse by the caller."""
+    return math.sin(angle), math.cos(angle)
+
+
+@lru_cache(maxsize=128)
+def _unit_arc(start_angle: float, end_angle: float, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cached (sin, cos) samples of an angular span at n + 1 equally spaced
+    angles. Concentric arcs (CHS walls, RHS inner/outer corners) and repeated
+    sections share one table, scaled by each arc's radius. The arrays are
+    shared between callers, so they are made read-only.
+    """
+    theta = np.linspace(start_angle, end_angle, n + 1)
+    s = np.sin(theta)
+    c = np.cos(theta)
+    s.flags.writeable = False
+    c.flags.writeable = False
+    return s, c
+
+
+@lru_cache(maxsize=16)
+def _bernstein(resolution: int) -> np.ndarray:
+    """
+    Cached cubic Bernstein basis sampled at resolution + 1 equally spaced t,
+    shape (resolution + 1, 4). Read-only since it is shared between curves.
+    """
+    t = np.linspace(0.0, 1.0, resolution + 1)
+    u = 1.0 - t
+    basis = np.ascontiguousarray(
+        np.stack([u * u * u, 3 * u * u * t, 3 * u * t * t, t * t * t], axis=1)
+    )
+    basis.flags.writeable = False
+    return basis
+
+
+# 5-point Gauss-Legendre rule mapped from [-1, 1] to [0, 1]
+_GAUSS5_NODES, _GAUSS5_WEIGHTS = np.polynomial.legendre.leggauss(5)
+_GAUSS5_NODES = tuple((0.5 * (_GAUSS5_NODES + 1.0)).tolist())
+_GAUSS5_WEIGHTS = tuple((0.5 * _GAUSS5_WEIGHTS).tolist())
+
+
+def _bezier_length_gauss5(p0: Point, p1: Point, p2: Point, p3: Point) -> float:
+    """
+    Length of a cubic Bezier by 5-point Gauss-Legendre quadrature of |B'(t)|,
+    with B'(t) = 3((1-t)^2 (p1-p0) + 2(1-t)t (p2-p1) + t^2 (p3-p2)).
+    """
+    ay, az = p1[0] - p0[0], p1[1] - p0[1]
+    by, bz = p2[0] - p1[0], p2[1] - p1[1]
+    cy, cz = p3[0] - p2[0], p3[1] - p2[1]
+    total = 0.0
+    for t, w in zip(_GAUSS5_NODES, _GAUSS5_WEIGHTS):
+        u = 1.0 - t
+        k0 = u * u
+        k1 = 2.0 * u * t
+        k2 = t * t
+        total += w * math.hypot(k0 * ay + k1 * by + k2 * cy, k0 * az + k1 * bz + k2 * cz)
+    return 3.0 * total
+
+
+# 8-point Gauss-Legendre rule mapped to [0, 1]: exact for the degree-11
+# boundary integrands of a cubic Bezier, and to machine precision for arcs
+# split into quarter turns
+_GAUSS8_NODES, _GAUSS8_WEIGHTS = np.polynomial.legendre.leggauss(8)
+_GAUSS8_NODES = 0.5 * (_GAUSS8_NODES + 1.0)
+_GAUSS8_WEIGHTS = 0.5 * _GAUSS8_WEIGHTS
+_GAUSS8_NODES.flags.writeable = False
+_GAUSS8_WEIGHTS.flags.writeable = False
+
+
+def _boundary_moments(y: np.ndarray, z: np.ndarray, wdz: np.ndarray) -> np.ndarray:
+    """
+    Area moments (A, ∫y dA, ∫z dA, ∫y² dA, ∫z² dA, ∫yz dA) contributed by a
+    boundary piece, from the Green's theorem line integrals
+    ∮y dz, ∮y²/2 dz, ∮yz dz, ∮y³/3 dz, ∮yz² dz and ∮y²z/2 dz.
+    
+    Args:
+        y, z: Boundary points at the quadrature nodes
+        wdz: Quadrature weights times dz/dt at the nodes
+    """
+    yw = y * wdz
+    yyw = y * yw
+    return np.array([
+        yw.sum(),
+        0.5 * yyw.sum(),
+        np.dot(yw, z),
+        np.dot(yyw, y) / 3.0,
+        np.dot(yw, z * z),
+        0.5 * np.dot(yyw, z),
+    ])
+
+
+def _point(p: Any) -> Point:
+    """A point given as any (y, z) pair (tuple, list, array row) as a float tuple."""
+    y, z = p
+    return (float(y), float(z))
+
+
+def _check_tolerance(tolerance: float) -> None:
+    """Reject a non-positive flattening tolerance."""
+    if not tolerance > 0:
+        raise ValueError(f"tolerance must be positive, got {tolerance}")
+
+
+@dataclass(frozen=True)
 class Line:
-    """A straight line segment from start to end."""
+    """
+    A straight line segment from start to end.
+    Segments are immutable (assigning a field raises FrozenInstanceError);
+    replace them in Contour.segments to change a shape.
+    """
     start: Point
     end: Point
 
+    def __post_init__(self) -> None:
+        # Normalise coordinates to float tuples so segments hash and compare
+        # by value whatever sequence type they were built from
+        object.__setattr__(self, 'start', _point(self.start))
+        object.__setattr__(self, 'end', _point(self.end))
+
     def discretize(self, resolution: int = 32) -> List[Point]:
         """
         Return discretized points along the line.
@@ -25,14 +146,17 @@ class Line:
         Args:
             resolution: Number of segments to split the line into.
         """
-        if resolution < 1:
-            resolution = 1
-            
-        points = []
-        for i in range(resolution + 1):
-            t = i / resolution
-            points.append(self.point_at(t))
-        return points
+        pts = self._sample(max(1, resolution))
+        return list(zip(pts[:, 0].tolist(), pts[:, 1].tolist()))
+
+    def _sample(self, resolution: int) -> np.ndarray:
+        """(resolution+1, 2) points evenly spaced from start to end."""
+        t = np.linspace(0.0, 1.0, resolution + 1)
+        y0, z0 = self.start
+        pts = np.empty((resolution + 1, 2), dtype=np.float64)
+        pts[:, 0] = y0 + (self.end[0] - y0) * t
+        pts[:, 1] = z0 + (self.end[1] - z0) * t
+        return pts
 
     def point_at(self, t: float) -> Point:
         """Get point at parameter t (0.0 to 1.0)."""
@@ -41,11 +165,17 @@ class Line:
             self.start[1] + (self.end[1] - self.start[1]) * t
         )
 
-    @property
+    @cached_property
     def length(self) -> float:
         """Length of the line segment."""
         return math.hypot(self.end[0] - self.start[0], self.end[1] - self.start[1])
 
+    def _moments(self) -> np.ndarray:
+        """Exact boundary contribution to the area moments (see ``_boundary_moments``)."""
+        (y0, z0), (y1, z1) = self.start, self.end
+        t = _GAUSS8_NODES
+        return _boundary_moments(y0 + (y1 - y0) * t, z0 + (z1 - z0) * t, _GAUSS8_WEIGHTS * (z1 - z0))
+
     def start_point(self) -> Point:
         return self.start
 
@@ -72,22 +202,38 @@ class Line:
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class Arc:
     """
     A circular arc defined by center, radius, and angles.
     Angles in radians: 0 is +z (Right), pi/2 is +y (Up).
+    Arcs are immutable so derived data (e.g. the Bezier approximation) can be
+    cached on the instance.
     """
     center: Point
     radius: float
     start_angle: float
     end_angle: float
 
+    def __post_init__(self) -> None:
+        # Normalised to floats so arcs hash and compare by value
+        object.__setattr__(self, 'center', _point(self.center))
+        object.__setattr__(self, 'radius', float(self.radius))
+        object.__setattr__(self, 'start_angle', float(self.start_angle))
+        object.__setattr__(self, 'end_angle', float(self.end_angle))
+
     def discretize(self, resolution: int = 32) -> List[Point]:
         """Convert arc to points."""
         if self.radius <= 1e-9:
             return [self.center]
-        
+        pts = self._sample(resolution)
+        return list(zip(pts[:, 0].tolist(), pts[:, 1].tolist()))
+
+    def _sample(self, resolution: int) -> np.ndarray:
+        """Sample the arc as an (n+1, 2) array of (y, z) points."""
+        if self.radius <= 1e-9:
+            return np.array([self.center], dtype=np.float64)
+
         # Determine number of points based on arc span
         angle_span = abs(self.end_angle - self.start_angle)
         # Ensure at least 'resolution' points for a full circle, scaled by span
@@ -107,39 +253,50 @@ class Arc:
         # But for backward compatibility with 'resolution' meaning 'density', let's stick to a safe max.
         n = max(n, resolution) 
 
-        points = []
         cy, cz = self.center
-        for i in range(n + 1):
-            theta = self.start_angle + (self.end_angle - self.start_angle) * i / n
-            y = cy + self.radius * math.sin(theta)
-            z = cz + self.radius * math.cos(theta)
-            points.append((y, z))
-        return points
+        sin_t, cos_t = _unit_arc(self.start_angle, self.end_angle, n)
+        pts = np.empty((n + 1, 2), dtype=np.float64)
+        pts[:, 0] = cy + self.radius * sin_t
+        pts[:, 1] = cz + self.radius * cos_t
+        return pts
 
     def point_at(self, t: float) -> Point:
         """Get point at parameter t (0.0 to 1.0)."""
         theta = self.start_angle + (self.end_angle - self.start_angle) * t
         cy, cz = self.center
-        y = cy + self.radius * math.sin(theta)
-        z = cz + self.radius * math.cos(theta)
-        return (y, z)
+        s, c = _sincos(theta)
+        return (cy + self.radius * s, cz + self.radius * c)
 
-    @property
+    @cached_property
     def length(self) -> float:
         """Length of the arc."""
         return self.radius * abs(self.end_angle - self.start_angle)
 
+    def _moments(self) -> np.ndarray:
+        """
+        Boundary contribution to the area moments (see ``_boundary_moments``),
+        integrated over quarter-turn pieces so the curvature is captured
+        exactly rather than by chords.
+        """
+        span = self.end_angle - self.start_angle
+        n = max(1, int(math.ceil(abs(span) / (math.pi / 2))))
+        t = ((np.arange(n)[:, None] + _GAUSS8_NODES) / n).ravel()
+        theta = self.start_angle + span * t
+        s = np.sin(theta)
+        cy, cz = self.center
+        r = self.radius
+        wdz = np.tile(_GAUSS8_WEIGHTS / n, n) * (-r * span * s)
+        return _boundary_moments(cy + r * s, cz + r * np.cos(theta), wdz)
+
     def start_point(self) -> Point:
         cy, cz = self.center
-        y = cy + self.radius * math.sin(self.start_angle)
-        z = cz + self.radius * math.cos(self.start_angle)
-        return (y, z)
+        s, c = _sincos(self.start_angle)
+        return (cy + self.radius * s, cz + self.radius * c)
 
     def end_point(self) -> Point:
         cy, cz = self.center
-        y = cy + self.radius * math.sin(self.end_angle)
-        z = cz + self.radius * math.cos(self.end_angle)
-        return (y, z)
+        s, c = _sincos(self.end_angle)
+        return (cy + self.radius * s, cz + self.radius * c)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -169,6 +326,11 @@ class Arc:
         Convert arc to cubic Bezier curves for native rendering.
         Uses the standard approximation: split arc into segments <= 90 degrees.
         """
+        return list(self.beziers)
+
+    @cached_property
+    def beziers(self) -> Tuple['CubicBezier', ...]:
+        """Cached Bezier approximation of the arc (see ``to_beziers``)."""
         beziers = []
         angle_span = self.end_angle - self.start_angle
         
@@ -179,31 +341,35 @@ class Arc:
         cy, cz = self.center
         r = self.radius
         
+        # Bezier control point factor for circular arc
+        # k = (4/3) * tan(angle/4)
+        k = (4.0 / 3.0) * math.tan(abs(segment_angle) / 4.0)
+        if segment_angle < 0:
+            k = -k
+        
+        # Each segment's end angle is the next one's start, so sin/cos are
+        # evaluated once per boundary and carried across iterations.
+        s1, c1 = _sincos(self.start_angle)
+        
         for i in range(num_segments):
-            a1 = self.start_angle + i * segment_angle
-            a2 = a1 + segment_angle
-            
-            # Bezier control point factor for circular arc
-            # k = (4/3) * tan(angle/4)
-            k = (4.0 / 3.0) * math.tan(abs(segment_angle) / 4.0)
-            if segment_angle < 0:
-                k = -k
+            a2 = self.start_angle + (i + 1) * segment_angle
+            s2, c2 = _sincos(a2)
             
             # Start and end points on arc
             # y = r*sin(theta), z = r*cos(theta) relative to center
-            p0_y = cy + r * math.sin(a1)
-            p0_z = cz + r * math.cos(a1)
-            p3_y = cy + r * math.sin(a2)
-            p3_z = cz + r * math.cos(a2)
+            p0_y = cy + r * s1
+            p0_z = cz + r * c1
+            p3_y = cy + r * s2
+            p3_z = cz + r * c2
             
             # Tangent directions (perpendicular to radius)
             # At angle theta: tangent direction is (cos(theta), -sin(theta)) for CCW
             # For our coord system where y=sin, z=cos:
             # dy/dtheta = r*cos(theta), dz/dtheta = -r*sin(theta)
-            t1_y = r * math.cos(a1)
-            t1_z = -r * math.sin(a1)
-            t2_y = r * math.cos(a2)
-            t2_z = -r * math.sin(a2)
+            t1_y = r * c1
+            t1_z = -r * s1
+            t2_y = r * c2
+            t2_z = -r * s2
             
             # Control points
             p1_y = p0_y + k * t1_y
@@ -217,11 +383,12 @@ class Arc:
                 p2=(p2_y, p2_z),
                 p3=(p3_y, p3_z)
             ))
+            s1, c1 = s2, c2
         
-        return beziers
+        return tuple(beziers)
 
 
-@dataclass
+@dataclass(frozen=True)
 class CubicBezier:
     """
     A cubic Bezier curve with 4 control points.
@@ -235,44 +402,86 @@ class CubicBezier:
     p2: Point
     p3: Point
 
-    def discretize(self, resolution: int = 32) -> List[Point]:
-        """Convert bezier to points using de Casteljau's algorithm."""
-        points = []
-        for i in range(resolution + 1):
-            t = i / resolution
-            point = self._evaluate(t)
-            points.append(point)
-        return points
+    def __post_init__(self) -> None:
+        # Normalised to float tuples so curves hash and compare by value
+        for name in ('p0', 'p1', 'p2', 'p3'):
+            object.__setattr__(self, name, _point(getattr(self, name)))
+
+    def discretize(self, resolution: int = 32, tolerance: Optional[float] = None) -> List[Point]:
+        """
+        Convert bezier to points by evaluating the Bernstein form.
+
+        Args:
+            resolution: Number of segments to sample
+            tolerance: If given, pick the number of segments adaptively so the
+                polyline deviates from the curve by at most this distance;
+                must be positive
+        """
+        if tolerance is not None:
+            _check_tolerance(tolerance)
+            resolution = self._flatten_count(tolerance)
+        pts = self._sample(resolution)
+        return list(zip(pts[:, 0].tolist(), pts[:, 1].tolist()))
+
+    def _sample(self, resolution: int) -> np.ndarray:
+        """(resolution+1, 2) samples: cached basis times the 4x2 control points."""
+        control = np.array([self.p0, self.p1, self.p2, self.p3], dtype=np.float64)
+        return _bernstein(resolution) @ control
+
+    def _flatten_count(self, tolerance: float) -> int:
+        """
+        Segments needed to stay within ``tolerance`` of the curve (Wang's
+        formula): n = ceil(sqrt(3/4 * M / tolerance)), where M is the largest
+        second difference of the control points.
+        """
+        (y0, z0), (y1, z1), (y2, z2), (y3, z3) = self.p0, self.p1, self.p2, self.p3
+        m = max(
+            math.hypot(y0 - 2 * y1 + y2, z0 - 2 * z1 + z2),
+            math.hypot(y1 - 2 * y2 + y3, z1 - 2 * z2 + z3),
+        )
+        return max(1, math.ceil(math.sqrt(0.75 * m / tolerance)))
 
     def point_at(self, t: float) -> Point:
         """Get point at parameter t (0.0 to 1.0)."""
         return self._evaluate(t)
 
-    @property
+    @cached_property
     def length(self) -> float:
-        """Approximate length of the Bezier curve."""
-        # Use discretization to approximate length
-        # A resolution of 32 is usually sufficient for a good approximation
-        points = self.discretize(32)
-        length = 0.0
-        for i in range(len(points) - 1):
-            p1 = points[i]
-            p2 = points[i+1]
-            length += math.hypot(p2[0] - p1[0], p2[1] - p1[1])
-        return length
+        """Length of the Bezier curve (Gauss-Legendre quadrature)."""
+        return _bezier_length_gauss5(self.p0, self.p1, self.p2, self.p3)
+
+    def _moments(self) -> np.ndarray:
+        """Exact boundary contribution to the area moments (see ``_boundary_moments``)."""
+        (y0, z0), (y1, z1), (y2, z2), (y3, z3) = self.p0, self.p1, self.p2, self.p3
+        t = _GAUSS8_NODES
+        u = 1.0 - t
+        b0, b1, b2, b3 = u * u * u, 3 * u * u * t, 3 * u * t * t, t * t * t
+        y = b0 * y0 + b1 * y1 + b2 * y2 + b3 * y3
+        z = b0 * z0 + b1 * z1 + b2 * z2 + b3 * z3
+        dz = 3 * (u * u * (z1 - z0) + 2 * u * t * (z2 - z1) + t * t * (z3 - z2))
+        return _boundary_moments(y, z, _GAUSS8_WEIGHTS * dz)
 
     def _evaluate(self, t: float) -> Point:
-        """Evaluate bezier at parameter t using de Casteljau."""
-        u = 1 - t
-        y = (u**3 * self.p0[0] + 
-             3 * u**2 * t * self.p1[0] + 
-             3 * u * t**2 * self.p2[0] + 
-             t**3 * self.p3[0])
-        z = (u**3 * self.p0[1] + 
-             3 * u**2 * t * self.p1[1] + 
-             3 * u * t**2 * self.p2[1] + 
-             t**3 * self.p3[1])
-        return (y, z)
+        """Evaluate bezier at parameter t (Horner form of the power basis)."""
+        (y0, z0), (y1, z1), (y2, z2), (y3, z3) = self._power_coefficients
+        return (
+            y0 + t * (y1 + t * (y2 + t * y3)),
+            z0 + t * (z1 + t * (z2 + t * z3)),
+        )
+
+    @cached_property
+    def _power_coefficients(self) -> Tuple[Point, Point, Point, Point]:
+        """
+        Coefficients of B(t) = a0 + a1*t + a2*t^2 + a3*t^3, derived once
+        from the control points so each evaluation is 3 multiply-adds per axis.
+        """
+        (y0, z0), (y1, z1), (y2, z2), (y3, z3) = self.p0, self.p1, self.p2, self.p3
+        return (
+            (y0, z0),
+            (3 * (y1 - y0), 3 * (z1 - z0)),
+            (3 * (y0 - 2 * y1 + y2), 3 * (z0 - 2 * z1 + z2)),
+            (y3 - y0 + 3 * (y1 - y2), z3 - z0 + 3 * (z1 - z2)),
+        )
 
     def start_point(self) -> Point:
         return self.p0
@@ -312,7 +521,9 @@ Segment = Union[Line, Arc, CubicBezier]
 class Contour:
     """
     A contour made up of connected curve segments.
-    Can be open or closed.
+    Can be open or closed. The segments themselves are immutable, but the
+    segments list can be edited or replaced; properties are cached by
+    content, so edits are always picked up.
     """
     segments: List[Segment] = field(default_factory=list)
     hollow: bool = False
@@ -333,26 +544,108 @@ class Contour:
         """Total length of the contour."""
         return sum(s.length for s in self.segments)
 
-    def discretize(self, resolution: int = 32) -> List[Point]:
-        """Convert all segments to a single list of points."""
+    def _moments(self) -> Optional[np.ndarray]:
+        """
+        Area moments (A, ∫y dA, ∫z dA, ∫y² dA, ∫z² dA, ∫yz dA) of the region
+        enclosed by the segments themselves, signed by winding. Gaps between
+        segments, including an open end, are bridged by straight lines, the
+        same boundary ``discretize`` traces (it keeps each gap's start point,
+        dropping only points within its closed-loop tolerance of the
+        previous one). None if a segment type has no boundary integrals.
+        """
         if not self.segments:
-            return []
-        
-        points = []
-        for i, segment in enumerate(self.segments):
-            seg_points = segment.discretize(resolution)
-            if i == 0:
-                points.extend(seg_points)
+            return None
+        total = np.zeros(6)
+        prev_end = self.segments[-1].end_point()
+        for segment in self.segments:
+            moments = getattr(segment, '_moments', None)
+            if moments is None:
+                return None
+            start = segment.start_point()
+            if start != prev_end:
+                total += Line(prev_end, start)._moments()
+            total += moments()
+            prev_end = segment.end_point()
+        return total
+
+    def discretize(self, resolution: int = 32, tolerance: Optional[float] = None) -> List[Point]:
+        """
+        Convert all segments to a single list of points.
+
+        Straight lines are represented exactly by their end points, so only
+        curved segments are sampled at ``resolution``. A contour built with
+        ``from_points`` therefore round-trips to its original vertices.
+        Where a segment does not start at the previous segment's end, its
+        start point is kept, bridging the gap with a straight edge.
+        If ``tolerance`` is given, Bezier segments are instead flattened
+        adaptively to within that distance.
+        """
+        return _as_points(self.discretize_xy(resolution, tolerance))
+
+    def to_arrays(self, resolution: int = 32, tolerance: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Discretize the contour into separate coordinate arrays.
+
+        Returns:
+            (ys, zs) as contiguous float64 arrays holding the same points as
+            ``discretize(resolution, tolerance)``.
+        """
+        ys, zs = self.discretize_xy(resolution, tolerance).T.copy()
+        return ys, zs
+
+    def discretize_xy(self, resolution: int = 32, tolerance: Optional[float] = None) -> np.ndarray:
+        """
+        Convert all segments to an (N, 2) float64 array of (y, z) points.
+
+        Same points as ``discretize``, without a tuple allocated per point.
+        """
+        if tolerance is not None:
+            _check_tolerance(tolerance)
+        if not self.segments:
+            return np.empty((0, 2), dtype=np.float64)
+
+        # Lines contribute only their end points; curves are sampled in bulk
+        samples = []
+        for segment in self.segments:
+            if isinstance(segment, Line):
+                samples.append(None)
+            elif tolerance is not None and isinstance(segment, CubicBezier):
+                samples.append(segment._sample(segment._flatten_count(tolerance)))
             else:
-                # Skip first point of subsequent segments (it's the same as last point)
-                points.extend(seg_points[1:])
-        
+                samples.append(segment._sample(resolution))
+
+        # A segment's first point normally repeats the previous segment's
+        # last point and is skipped; where it does not (a gap), it is kept,
+        # so the gap is bridged by a straight edge as in ``_moments``
+        firsts = [segment.start if sample is None else sample[0]
+                  for segment, sample in zip(self.segments, samples)]
+        lasts = [segment.end if sample is None else sample[-1]
+                 for segment, sample in zip(self.segments, samples)]
+        gaps = [False] + [not self._points_equal(prev, first)
+                          for prev, first in zip(lasts, firsts[1:])]
+        count = 1 + sum(1 if s is None else len(s) - 1 for s in samples) + sum(gaps)
+        pts = np.empty((count, 2), dtype=np.float64)
+
+        pts[0] = firsts[0]
+        idx = 1
+        for segment, sample, first, gap in zip(self.segments, samples, firsts, gaps):
+            if gap:
+                pts[idx] = first
+                idx += 1
+            if sample is None:
+                pts[idx] = segment.end
+                idx += 1
+            else:
+                k = len(sample) - 1
+                pts[idx:idx + k] = sample[1:]
+                idx += k
+
         # Remove last point if it duplicates first (closed contour)
-        if len(points) > 1 and self._points_equal(points[0], points[-1]):
-            points = points[:-1]
-        
-        return points
-    
+        if count > 1 and self._points_equal(pts[0], pts[-1]):
+            pts = pts[:-1]
+
+        return pts
+
     def discretize_uniform(self, count: int = 100) -> List[Point]:
         """
         Discretize the contour into a fixed number of equally spaced points.
@@ -366,12 +659,11 @@ class Contour:
         if not self.segments:
             return []
             
-        total_length = self.length
+        seg_lengths = np.array([s.length for s in self.segments], dtype=np.float64)
+        total_length = float(seg_lengths.sum())
         if total_length < 1e-9:
             return [self.segments[0].start_point()] * count
             
-        points: List[Point] = []
-        
         # We want 'count' points.
         # If closed, we might want the last point to match the first, 
         # but typically 'discretize' implies unique points for closed loops 
@@ -382,40 +674,34 @@ class Contour:
         # and start==end for closed (so returned list has duplicate start/end).
         
         step = total_length / max(1, count - 1) if not self.is_closed else total_length / count
+        targets = step * np.arange(1, count)
         
-        current_dist = 0.0
-        accumulated_len = 0.0
+        # Locate the segment holding each target distance in one pass over
+        # the cumulative lengths rather than walking the segments per point
+        cum_end = np.cumsum(seg_lengths)
+        seg_idx = np.searchsorted(cum_end, targets - 1e-9, side='left')
         
-        current_seg_idx = 0
+        # Targets past the end (floating point errors) map to the last point
+        n_segs = len(self.segments)
+        in_range = seg_idx < n_segs
+        idx = np.minimum(seg_idx, n_segs - 1)
+        local_dist = targets - (cum_end[idx] - seg_lengths[idx])
+        safe_len = np.where(seg_lengths[idx] > 1e-9, seg_lengths[idx], 1.0)
+        ts = np.where(seg_lengths[idx] > 1e-9, local_dist / safe_len, 0.0)
+        ts = np.clip(ts, 0.0, 1.0)
         
         # Start with the first point
-        points.append(self.segments[0].start_point())
-        
-        for i in range(1, count):
-            target_dist = i * step
-            
-            # Find which segment contains the target distance
-            while current_seg_idx < len(self.segments):
-                seg = self.segments[current_seg_idx]
-                seg_len = seg.length
-                
-                if accumulated_len + seg_len >= target_dist - 1e-9:
-                    # Point is in this segment
-                    local_dist = target_dist - accumulated_len
-                    t = local_dist / seg_len if seg_len > 1e-9 else 0.0
-                    points.append(seg.point_at(max(0.0, min(1.0, t))))
-                    break
-                else:
-                    accumulated_len += seg_len
-                    current_seg_idx += 1
-            else:
-                # If we ran past the end (floating point errors), assume last point
-                points.append(self.segments[-1].end_point())
+        points: List[Point] = [self.segments[0].start_point()]
+        end_point = self.segments[-1].end_point()
+        for k, t, ok in zip(idx.tolist(), ts.tolist(), in_range.tolist()):
+            points.append(self.segments[k].point_at(t) if ok else end_point)
                 
         return points
 
     def _points_equal(self, p1: Point, p2: Point, tol: float = 1e-4) -> bool:
-        return abs(p1[0] - p2[0]) < tol and abs(p1[1] - p2[1]) < tol
+        dy = p1[0] - p2[0]
+        dz = p1[1] - p2[1]
+        return dy * dy + dz * dz < tol * tol
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -477,14 +763,18 @@ class Geometry:
             return False
         return all(c.is_closed for c in self.contours)
 
-    def get_discretized_contours(self, resolution: int = 32) -> List[Tuple[List[Point], bool]]:
+    def get_discretized_contours(self, resolution: int = 32, tolerance: Optional[float] = None) -> List[Tuple[List[Point], bool]]:
         """
         Get discretized points for each contour.
         
+        Args:
+            resolution: Sampling resolution for curved segments.
+            tolerance: Optional flattening tolerance for Bezier segments.
+            
         Returns:
             List of (points, hollow) tuples for each contour.
         """
-        return [(c.discretize(resolution), c.hollow) for c in self.contours]
+        return [(c.discretize(resolution, tolerance), c.hollow) for c in self.contours]
     
     def discretize_uniform(self, count: int = 100) -> List[Tuple[List[Point], bool]]:
         """
@@ -502,18 +792,24 @@ class Geometry:
         """
         Clip polygons to handle holes. Returns discretized points with hollow flags.
         """
-        discretized = self.get_discretized_contours()
+        return [(_as_points(pts), hollow) for pts, hollow in self._reduce_hollows_xy()]
+
+    def _reduce_hollows_xy(self) -> List[Tuple[np.ndarray, bool]]:
+        """Same as reduce_hollows, but with each contour as an (N, 2) array."""
+        discretized = [(c.discretize_xy(), c.hollow) for c in self.contours]
         return _reduce_hollows_impl(discretized)
 
     def calculate_properties(self) -> 'SectionProperties':
-        """Calculate section properties."""
-        from .properties import calculate_exact_properties, calculate_grid_properties, SectionProperties
-        
-        reduced = self.reduce_hollows()
-        props = calculate_exact_properties(reduced)
-        calculate_grid_properties(props, reduced)
-        
-        return props
+        """
+        Calculate section properties.
+
+        Results are cached by geometry content (segments are immutable and
+        hashable), so building the same section again - e.g. repeated
+        library calls with identical dimensions - skips the calculation.
+        Each call returns its own SectionProperties copy.
+        """
+        key = tuple((tuple(c.segments), c.hollow) for c in self.contours)
+        return replace(_properties_for(key))
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert geometry to dictionary with schema version."""
@@ -542,14 +838,26 @@ class Geometry:
 
     def to_json(self, file_path: str) -> None:
         """Save geometry to a JSON file."""
+        if orjson is not None:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    self.to_dict(),
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                    default=_json_default,
+                ))
+            return
         with open(file_path, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+            json.dump(self.to_dict(), f, indent=2, default=_json_default)
 
     @classmethod
     def from_json(cls, file_path: str) -> 'Geometry':
         """Load geometry from a JSON file."""
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(file_path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(file_path, 'r') as f:
+                data = json.load(f)
         return cls.from_dict(data)
 
     @classmethod
@@ -569,77 +877,284 @@ class Geometry:
 # Geometry Utils (Clipping)
 # -----------------------------------------------------------------------------
 
-def _reduce_hollows_impl(discretized: List[Tuple[List[Point], bool]]) -> List[Tuple[List[Point], bool]]:
+@lru_cache(maxsize=256)
+def _properties_for(key: Tuple[Tuple[Tuple[Segment, ...], bool], ...]) -> 'SectionProperties':
+    """
+    Calculate properties for a geometry given as ((segments, hollow), ...).
+    Cached; callers must copy the result before handing it out.
+    """
+    from .properties import calculate_exact_properties, calculate_grid_properties
+    
+    geometry = Geometry(contours=[Contour(list(segments), hollow) for segments, hollow in key])
+    reduced = geometry._reduce_hollows_xy()
+    props = calculate_exact_properties(reduced, moments=_exact_moments(geometry.contours, reduced))
+    calculate_grid_properties(props, reduced, J=_analytic_torsion(geometry.contours))
+    
+    return props
+
+
+def _exact_moments(
+    contours: List[Contour], 
+    reduced: List[Tuple[np.ndarray, bool]]
+) -> List[Optional[np.ndarray]]:
+    """
+    Segment-exact area moments for each entry of ``reduced`` where they
+    apply, else None. Solids are never clipped; hollows only qualify when
+    every one survived clipping unchanged (lying wholly within a solid),
+    since a clipped hollow's boundary is no longer its own segments.
+    """
+    solids = [c for c in contours if not c.hollow]
+    hollows = [c for c in contours if c.hollow]
+    moments = [c._moments() for c in solids]
+    
+    clipped = reduced[len(solids):]
+    if len(clipped) == len(hollows) and all(
+        np.array_equal(pts, c.discretize_xy()) for (pts, _), c in zip(clipped, hollows)
+    ):
+        moments.extend(c._moments() for c in hollows)
+    else:
+        moments.extend([None] * len(clipped))
+    return moments
+
+
+def _analytic_torsion(contours: List[Contour]) -> Optional[float]:
+    """
+    Closed-form torsion constant for a solid rectangle, a solid circle or a
+    concentric circular tube; None for any other shape.
+    """
+    solids = [c for c in contours if not c.hollow]
+    hollows = [c for c in contours if c.hollow]
+    if len(solids) != 1 or len(hollows) > 1:
+        return None
+    
+    outer = _as_circle(solids[0])
+    if outer is not None:
+        center, R = outer
+        r = 0.0
+        if hollows:
+            inner = _as_circle(hollows[0])
+            if inner is None or not solids[0]._points_equal(inner[0], center) or inner[1] >= R:
+                return None
+            r = inner[1]
+        # Polar moment: exact for circular sections
+        return 0.5 * math.pi * (R**4 - r**4)
+    
+    sides = None if hollows else _as_rectangle(solids[0])
+    if sides is None:
+        return None
+    # Roark's series approximation, a >= b the side lengths
+    a, b = max(sides), min(sides)
+    return a * b**3 * (1.0 / 3.0 - 0.21 * (b / a) * (1.0 - b**4 / (12.0 * a**4)))
+
+
+def _as_circle(contour: Contour) -> Optional[Tuple[Point, float]]:
+    """(center, radius) if the contour is one full turn of a single circle."""
+    segments = contour.segments
+    if not segments or any(type(s) is not Arc for s in segments):
+        return None
+    first = segments[0]
+    for s in segments[1:]:
+        if not contour._points_equal(s.center, first.center) or abs(s.radius - first.radius) > 1e-9:
+            return None
+    span = sum(abs(s.end_angle - s.start_angle) for s in segments)
+    if abs(span - 2 * math.pi) > 1e-9 or not contour.is_closed:
+        return None
+    return first.center, first.radius
+
+
+def _as_rectangle(contour: Contour) -> Optional[Tuple[float, float]]:
+    """Side lengths if the contour is a closed four-sided polygon with right angles."""
+    lines = [s for s in contour.segments if type(s) is Line and s.length > 1e-9]
+    if len(lines) != 4 or len(lines) != len(contour.segments) or not contour.is_closed:
+        return None
+    for i, line in enumerate(lines):
+        nxt = lines[(i + 1) % 4]
+        if not contour._points_equal(line.end, nxt.start):
+            return None
+        dot = ((line.end[0] - line.start[0]) * (nxt.end[0] - nxt.start[0])
+               + (line.end[1] - line.start[1]) * (nxt.end[1] - nxt.start[1]))
+        if abs(dot) > 1e-9 * line.length * nxt.length:
+            return None
+    return lines[0].length, lines[1].length
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    JSON fallback for NumPy scalars, shared by the orjson and stdlib paths
+    so both accept and reject the same values.
+    """
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _as_points(pts: np.ndarray) -> List[Point]:
+    """Convert an (N, 2) array to a list of (y, z) tuples."""
+    return list(zip(pts[:, 0].tolist(), pts[:, 1].tolist()))
+
+
+def _reduce_hollows_impl(discretized: List[Tuple[Union[List[Point], np.ndarray], bool]]) -> List[Tuple[np.ndarray, bool]]:
     """
     Clip polygons to handle holes.
     
     Args:
-        discretized: List of (points, hollow) tuples
+        discretized: List of (points, hollow) tuples, where points may be a
+            list of tuples or an (N, 2) array
         
     Returns:
-        List of (points, hollow) tuples with holes clipped to solids
+        List of (points, hollow) tuples with holes clipped to solids, the
+        points being (N, 2) float arrays
     """
-    solids = [(pts, h) for pts, h in discretized if not h]
-    hollows = [(pts, h) for pts, h in discretized if h]
+    # Split in one pass, orienting each solid once as it is seen: the solids
+    # are the clippers for every hollow and their winding never changes.
+    reduced = []
+    clippers = []
+    hollows = []
+    for pts, h in discretized:
+        if h:
+            hollows.append(pts)
+            continue
+        arr = np.asarray(pts, dtype=np.float64)
+        reduced.append((arr, h))
+        if len(arr):
+            clippers.append((_orient_ccw(pts), arr.min(axis=0), arr.max(axis=0)))
     
     if not hollows:
-        return solids
-        
-    reduced = list(solids)
-    for h_pts, _ in hollows:
-        for s_pts, _ in solids:
-            clipped_points = _clip_polygon(h_pts, s_pts)
+        return reduced
+
+    for h_pts in hollows:
+        h_arr = np.asarray(h_pts, dtype=np.float64)
+        if not len(h_arr):
+            continue
+        h_lo = h_arr.min(axis=0)
+        h_hi = h_arr.max(axis=0)
+        for clipper, lo, hi in clippers:
+            # Disjoint bounding boxes cannot intersect
+            if (hi < h_lo).any() or (lo > h_hi).any():
+                continue
+            clipped_points = _clip_polygon(h_pts, clipper)
             if len(clipped_points) >= 3 and abs(_polygon_area_signed(clipped_points)) > 1e-9:
                 reduced.append((clipped_points, True))
     return reduced
 
 
-def _polygon_area_signed(points: List[Point]) -> float:
+def _polygon_area_signed(points: Union[List[Point], np.ndarray]) -> float:
     """Calculate signed area of polygon using shoelace formula."""
-    area = 0.0
-    for i in range(len(points)):
-        j = (i + 1) % len(points)
-        area += points[i][0] * points[j][1]
-        area -= points[j][0] * points[i][1]
-    return 0.5 * area
-
-
-def _clip_polygon(subject: List[Point], clipper: List[Point]) -> List[Point]:
-    """Sutherland-Hodgman clipping."""
-    def inside(p, cp1, cp2):
-        return (cp2[0]-cp1[0])*(p[1]-cp1[1]) - (cp2[1]-cp1[1])*(p[0]-cp1[0]) >= 0
-    
-    def compute_intersection(cp1, cp2, s, e):
-        dc = [cp1[0] - cp2[0], cp1[1] - cp2[1]]
-        dp = [s[0] - e[0], s[1] - e[1]]
-        n1 = cp1[0] * cp2[1] - cp1[1] * cp2[0]
-        n2 = s[0] * e[1] - s[1] * e[0]
-        det = dc[0] * dp[1] - dc[1] * dp[0]
-        if abs(det) < 1e-9: 
-            return e
-        n3 = 1.0 / det
-        return ((n1 * dp[0] - n2 * dc[0]) * n3, (n1 * dp[1] - n2 * dc[1]) * n3)
+    n = len(points)
+    if n < 16 and not isinstance(points, np.ndarray):
+        # Converting tiny polygons to arrays costs more than the loop
+        area = 0.0
+        for i in range(n):
+            j = (i + 1) % n
+            area += points[i][0] * points[j][1]
+            area -= points[j][0] * points[i][1]
+        return 0.5 * area
     
-    output = list(subject)
-    if _polygon_area_signed(clipper) < 0:
-        clipper_oriented = list(reversed(clipper))
-    else:
-        clipper_oriented = list(clipper)
-        
-    cp1 = clipper_oriented[-1]
-    for cp2 in clipper_oriented:
+    pts = np.asarray(points, dtype=np.float64)
+    y = pts[:, 0]
+    z = pts[:, 1]
+    return 0.5 * float(np.dot(y, np.roll(z, -1)) - np.dot(z, np.roll(y, -1)))
+
+
+def _orient_ccw(points: Union[List[Point], np.ndarray]) -> Union[List[Point], np.ndarray]:
+    """Return the polygon with counter-clockwise (positive area) winding."""
+    if isinstance(points, np.ndarray):
+        return points[::-1] if _polygon_area_signed(points) < 0 else points
+    if _polygon_area_signed(points) < 0:
+        return list(reversed(points))
+    return list(points)
+
+
+def _clip_polygon(
+    subject: Union[List[Point], np.ndarray], clipper: Union[List[Point], np.ndarray]
+) -> np.ndarray:
+    """
+    Sutherland-Hodgman clipping. Returns the clipped polygon as an (N, 2)
+    array, which has shape (0, 2) when nothing is left.
+
+    Small subjects are clipped in a scalar loop and large ones with NumPy.
+
+    Args:
+        subject: Polygon to clip, as a list of points or an (N, 2) array
+        clipper: Counter-clockwise clipping polygon, as a list of points or an
+            (N, 2) array. Callers orient it with ``_orient_ccw`` once, since a
+            clipper is usually reused for several subjects.
+    """
+    if isinstance(clipper, np.ndarray):
+        # Plain floats unpack far faster than NumPy rows in the loops below
+        clipper = clipper.tolist()
+    if len(subject) >= _VECTOR_CLIP_MIN_POINTS:
+        return _clip_polygon_vectorized(subject, clipper)
+
+    output = _as_points(subject) if isinstance(subject, np.ndarray) else list(subject)
+    cp1x, cp1y = clipper[-1]
+    for cp2x, cp2y in clipper:
         input_list = output
         output = []
         if not input_list:
             break
-        s = input_list[-1]
+        # Edge direction and line constant for this clip edge. The
+        # inside test and the intersection are inlined, and each vertex's
+        # side is computed once and carried over as the next edge start.
+        ax = cp2x - cp1x
+        ay = cp2y - cp1y
+        n1 = cp1x * cp2y - cp1y * cp2x
+        sx, sy = input_list[-1]
+        s_in = ax * (sy - cp1y) - ay * (sx - cp1x) >= 0
         for e in input_list:
-            if inside(e, cp1, cp2):
-                if not inside(s, cp1, cp2):
-                    output.append(compute_intersection(cp1, cp2, s, e))
+            ex, ey = e
+            e_in = ax * (ey - cp1y) - ay * (ex - cp1x) >= 0
+            if e_in != s_in:
+                dpx = sx - ex
+                dpy = sy - ey
+                det = ay * dpx - ax * dpy
+                if abs(det) < 1e-9:
+                    output.append((ex, ey))
+                else:
+                    n2 = sx * ey - sy * ex
+                    n3 = 1.0 / det
+                    output.append(((n1 * dpx + n2 * ax) * n3, (n1 * dpy + n2 * ay) * n3))
+            if e_in:
                 output.append(e)
-            elif inside(s, cp1, cp2):
-                output.append(compute_intersection(cp1, cp2, s, e))
-            s = e
-        cp1 = cp2
-    return output
+            sx, sy, s_in = ex, ey, e_in
+        cp1x, cp1y = cp2x, cp2y
+    return np.asarray(output, dtype=np.float64).reshape(-1, 2)
+
+
+# Below this many subject vertices the scalar loop beats NumPy call overhead
+_VECTOR_CLIP_MIN_POINTS = 128
+
+
+def _clip_polygon_vectorized(subject: Union[List[Point], np.ndarray], clipper: List[Point]) -> np.ndarray:
+    """
+    Sutherland-Hodgman clipping with each clip edge applied to the whole
+    subject at once. Expects a counter-clockwise clipper. The result stays
+    an (N, 2) array; it is the subject itself when nothing is clipped.
+    """
+    pts = np.asarray(subject, dtype=np.float64)
+    
+    cp1y, cp1z = clipper[-1]
+    for cp2y, cp2z in clipper:
+        # Side of the clip edge for every vertex at once
+        d = (cp2y - cp1y) * (pts[:, 1] - cp1z) - (cp2z - cp1z) * (pts[:, 0] - cp1y)
+        cp1y, cp1z = cp2y, cp2z
+        inside = d >= 0
+        if inside.all():
+            # Typical for holes lying within a solid: nothing to clip
+            continue
+        if not inside.any():
+            return pts[:0]
+        
+        # Edges s -> e (s = e - 1, wrapping) that cross the clip line
+        e_idx = np.flatnonzero(inside != np.roll(inside, 1))
+        s_idx = e_idx - 1
+        t = d[s_idx] / (d[s_idx] - d[e_idx])
+        hits = pts[s_idx] + t[:, None] * (pts[e_idx] - pts[s_idx])
+        
+        # Emit per vertex: the crossing into it (if any), then the vertex
+        # itself (if inside), preserving the Sutherland-Hodgman order
+        keep_idx = np.flatnonzero(inside)
+        order = np.argsort(np.concatenate([2 * e_idx, 2 * keep_idx + 1]), kind='stable')
+        pts = np.concatenate([hits, pts[keep_idx]])[order]
+    
+    return pts
@@ -0,0 +1,9 @@
+import math
+
+# Common arc angles (0 is +z, pi/2 is +y), shared by the section library
+PI = math.pi
+HALF_PI = math.pi / 2
+THREE_HALF_PI = 3 * math.pi / 2
+TWO_PI = 2 * math.pi
+
+__all__ = ["PI", "HALF_PI", "THREE_HALF_PI", "TWO_PI"]
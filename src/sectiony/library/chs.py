@@ -1,5 +1,5 @@
-import math
 from ..geometry import Geometry, Contour, Arc
+from .angles import TWO_PI
 from ..section import Section
 
 
@@ -20,13 +20,13 @@ def chs(d: float, t: float) -> Section:
     # Outer circle: single arc from 0 to 2*pi
     # Center at origin (0, 0)
     outer_contour = Contour(
-        segments=[Arc(center=(0, 0), radius=R, start_angle=0, end_angle=2*math.pi)],
+        segments=[Arc(center=(0, 0), radius=R, start_angle=0, end_angle=TWO_PI)],
         hollow=False
     )
     
     # Inner circle (hollow)
     inner_contour = Contour(
-        segments=[Arc(center=(0, 0), radius=r_inner, start_angle=0, end_angle=2*math.pi)],
+        segments=[Arc(center=(0, 0), radius=r_inner, start_angle=0, end_angle=TWO_PI)],
         hollow=True
     )
     
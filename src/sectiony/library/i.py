@@ -1,5 +1,5 @@
-import math
 from ..geometry import Geometry, Contour, Line, Arc
+from .angles import PI, HALF_PI, THREE_HALF_PI
 from ..section import Section
 
 
@@ -20,6 +20,9 @@ def i(d: float, b: float, tf: float, tw: float, r: float) -> Section:
     half_d = d / 2
     half_b = b / 2
     half_tw = tw / 2
+    y_in = half_d - tf   # Flange inner face
+    y_fc = y_in - r      # Fillet centre height
+    z_fc = half_tw + r   # Fillet centre offset from the web axis
     
     # Fillet geometry
     # When r > 0, fillets curve from flange inner face to web outer face
@@ -33,79 +36,71 @@ def i(d: float, b: float, tf: float, tw: float, r: float) -> Section:
     segments.append(Line(start=(half_d, half_b), end=(half_d, -half_b)))
     
     # 2. Left edge of top flange: Top-Left outer down to flange inner
-    segments.append(Line(start=(half_d, -half_b), end=(half_d - tf, -half_b)))
+    segments.append(Line(start=(half_d, -half_b), end=(y_in, -half_b)))
     
     if use_fillet:
         # 3. Horizontal to fillet start
-        segments.append(Line(start=(half_d - tf, -half_b), end=(half_d - tf, -half_tw - r)))
+        segments.append(Line(start=(y_in, -half_b), end=(y_in, -z_fc)))
         
         # 4. Top-Left Fillet arc
-        cy = half_d - tf - r
-        cz = -half_tw - r
-        segments.append(Arc(center=(cy, cz), radius=r, start_angle=math.pi/2, end_angle=0))
+        segments.append(Arc(center=(y_fc, -z_fc), radius=r, start_angle=HALF_PI, end_angle=0))
         
         # 5. Left web edge (going down)
-        segments.append(Line(start=(half_d - tf - r, -half_tw), end=(-half_d + tf + r, -half_tw)))
+        segments.append(Line(start=(y_fc, -half_tw), end=(-y_fc, -half_tw)))
         
         # 6. Bottom-Left Fillet arc
-        cy = -half_d + tf + r
-        cz = -half_tw - r
-        segments.append(Arc(center=(cy, cz), radius=r, start_angle=0, end_angle=-math.pi/2))
+        segments.append(Arc(center=(-y_fc, -z_fc), radius=r, start_angle=0, end_angle=-HALF_PI))
         
         # 7. Horizontal from fillet to flange edge
-        segments.append(Line(start=(-half_d + tf, -half_tw - r), end=(-half_d + tf, -half_b)))
+        segments.append(Line(start=(-y_in, -z_fc), end=(-y_in, -half_b)))
     else:
         # No fillet - sharp corners
         # 3. Horizontal to web
-        segments.append(Line(start=(half_d - tf, -half_b), end=(half_d - tf, -half_tw)))
+        segments.append(Line(start=(y_in, -half_b), end=(y_in, -half_tw)))
         
         # 4. Left web edge (going down)
-        segments.append(Line(start=(half_d - tf, -half_tw), end=(-half_d + tf, -half_tw)))
+        segments.append(Line(start=(y_in, -half_tw), end=(-y_in, -half_tw)))
         
         # 5. Horizontal from web to flange edge
-        segments.append(Line(start=(-half_d + tf, -half_tw), end=(-half_d + tf, -half_b)))
+        segments.append(Line(start=(-y_in, -half_tw), end=(-y_in, -half_b)))
     
     # 8. Bottom flange left edge going down
-    segments.append(Line(start=(-half_d + tf, -half_b), end=(-half_d, -half_b)))
+    segments.append(Line(start=(-y_in, -half_b), end=(-half_d, -half_b)))
     
     # 9. Bottom edge: Bottom-Left to Bottom-Right (outer)
     segments.append(Line(start=(-half_d, -half_b), end=(-half_d, half_b)))
     
     # 10. Right edge of bottom flange going up
-    segments.append(Line(start=(-half_d, half_b), end=(-half_d + tf, half_b)))
+    segments.append(Line(start=(-half_d, half_b), end=(-y_in, half_b)))
     
     if use_fillet:
         # 11. Horizontal to fillet
-        segments.append(Line(start=(-half_d + tf, half_b), end=(-half_d + tf, half_tw + r)))
+        segments.append(Line(start=(-y_in, half_b), end=(-y_in, z_fc)))
         
         # 12. Bottom-Right Fillet arc
-        cy = -half_d + tf + r
-        cz = half_tw + r
-        segments.append(Arc(center=(cy, cz), radius=r, start_angle=3*math.pi/2, end_angle=math.pi))
+        segments.append(Arc(center=(-y_fc, z_fc), radius=r, start_angle=THREE_HALF_PI, end_angle=PI))
         
         # 13. Right web edge (going up)
-        segments.append(Line(start=(-half_d + tf + r, half_tw), end=(half_d - tf - r, half_tw)))
+        segments.append(Line(start=(-y_fc, half_tw), end=(y_fc, half_tw)))
         
         # 14. Top-Right Fillet arc
-        cy = half_d - tf - r
-        cz = half_tw + r
-        segments.append(Arc(center=(cy, cz), radius=r, start_angle=math.pi, end_angle=math.pi/2))
+        segments.append(Arc(center=(y_fc, z_fc), radius=r, start_angle=PI, end_angle=HALF_PI))
         
         # 15. Horizontal from fillet to flange edge
-        segments.append(Line(start=(half_d - tf, half_tw + r), end=(half_d - tf, half_b)))
+        segments.append(Line(start=(y_in, z_fc), end=(y_in, half_b)))
     else:
         # No fillet - sharp corners
         # 11. Horizontal to web
-        segments.append(Line(start=(-half_d + tf, half_b), end=(-half_d + tf, half_tw)))
+        segments.append(Line(start=(-y_in, half_b), end=(-y_in, half_tw)))
         
         # 12. Right web edge (going up)
-        segments.append(Line(start=(-half_d + tf, half_tw), end=(half_d - tf, half_tw)))
+        segments.append(Line(start=(-y_in, half_tw), end=(y_in, half_tw)))
         
         # 13. Horizontal from web to flange edge
-        segments.append(Line(start=(half_d - tf, half_tw), end=(half_d - tf, half_b)))
+        segments.append(Line(start=(y_in, half_tw), end=(y_in, half_b)))
     
     # 16. Top flange right inner edge going up, closing the loop
-    segments.append(Line(start=(half_d - tf, half_b), end=(half_d, half_b)))
+    segments.append(Line(start=(y_in, half_b), end=(half_d, half_b)))
     
     contour = Contour(segments=segments, hollow=False)
     geom = Geometry(contours=[contour])
@@ -1,5 +1,5 @@
-import math
 from ..geometry import Geometry, Contour, Line, Arc
+from .angles import PI, HALF_PI, THREE_HALF_PI, TWO_PI
 from ..section import Section
 
 
@@ -53,25 +53,25 @@ def _rounded_rect_segments(h: float, b: float, r: float):
         
         # Start at right side of top-right corner, go CCW
         # Top-Right Corner arc (0 to 90 deg)
-        segments.append(Arc(center=(cy, cz), radius=r, start_angle=0, end_angle=math.pi/2))
+        segments.append(Arc(center=(cy, cz), radius=r, start_angle=0, end_angle=HALF_PI))
         
         # Top edge
         segments.append(Line(start=(half_h, cz), end=(half_h, -cz)))
         
         # Top-Left Corner arc (90 to 180 deg)
-        segments.append(Arc(center=(cy, -cz), radius=r, start_angle=math.pi/2, end_angle=math.pi))
+        segments.append(Arc(center=(cy, -cz), radius=r, start_angle=HALF_PI, end_angle=PI))
         
         # Left edge
         segments.append(Line(start=(cy, -half_b), end=(-cy, -half_b)))
         
         # Bottom-Left Corner arc (180 to 270 deg)
-        segments.append(Arc(center=(-cy, -cz), radius=r, start_angle=math.pi, end_angle=3*math.pi/2))
+        segments.append(Arc(center=(-cy, -cz), radius=r, start_angle=PI, end_angle=THREE_HALF_PI))
         
         # Bottom edge
         segments.append(Line(start=(-half_h, -cz), end=(-half_h, cz)))
         
         # Bottom-Right Corner arc (270 to 360 deg)
-        segments.append(Arc(center=(-cy, cz), radius=r, start_angle=3*math.pi/2, end_angle=2*math.pi))
+        segments.append(Arc(center=(-cy, cz), radius=r, start_angle=THREE_HALF_PI, end_angle=TWO_PI))
         
         # Right edge (back to start)
         segments.append(Line(start=(-cy, half_b), end=(cy, half_b)))
@@ -1,5 +1,5 @@
-import math
 from ..geometry import Geometry, Contour, Line, Arc
+from .angles import PI, HALF_PI, THREE_HALF_PI
 from ..section import Section
 
 
@@ -20,6 +20,10 @@ def u(b: float, h: float, tw: float, tf: float, r: float) -> Section:
     # Key coordinates
     half_h = h / 2
     half_b = b / 2
+    y_in = half_h - tf    # Flange inner face
+    z_web = -half_b + tw  # Web inner face
+    y_c = half_h - r      # Corner centre height
+    z_c = -half_b + r     # Corner centre offset
     
     use_outer_fillet = r > 1e-9
     ri = max(0.0, r - tw)  # Inner radius (based on web thickness)
@@ -29,23 +33,19 @@ def u(b: float, h: float, tw: float, tf: float, r: float) -> Section:
     
     # 1. Top flange outer: Top-Right to near Top-Left corner
     if use_outer_fillet:
-        segments.append(Line(start=(half_h, half_b), end=(half_h, -half_b + r)))
+        segments.append(Line(start=(half_h, half_b), end=(half_h, z_c)))
         
         # 2. Top-Left outer corner arc
-        cy = half_h - r
-        cz = -half_b + r
-        segments.append(Arc(center=(cy, cz), radius=r, start_angle=math.pi/2, end_angle=math.pi))
+        segments.append(Arc(center=(y_c, z_c), radius=r, start_angle=HALF_PI, end_angle=PI))
         
         # 3. Left web outer edge (going down) 
-        segments.append(Line(start=(half_h - r, -half_b), end=(-half_h + r, -half_b)))
+        segments.append(Line(start=(y_c, -half_b), end=(-y_c, -half_b)))
         
         # 4. Bottom-Left outer corner arc
-        cy = -half_h + r
-        cz = -half_b + r
-        segments.append(Arc(center=(cy, cz), radius=r, start_angle=math.pi, end_angle=3*math.pi/2))
+        segments.append(Arc(center=(-y_c, z_c), radius=r, start_angle=PI, end_angle=THREE_HALF_PI))
         
         # 5. Bottom flange outer: to Bottom-Right
-        segments.append(Line(start=(-half_h, -half_b + r), end=(-half_h, half_b)))
+        segments.append(Line(start=(-half_h, z_c), end=(-half_h, half_b)))
     else:
         # Sharp corners
         segments.append(Line(start=(half_h, half_b), end=(half_h, -half_b)))
@@ -53,36 +53,32 @@ def u(b: float, h: float, tw: float, tf: float, r: float) -> Section:
         segments.append(Line(start=(-half_h, -half_b), end=(-half_h, half_b)))
     
     # 6. Bottom-Right tip: outer to inner (going up inside the flange)
-    segments.append(Line(start=(-half_h, half_b), end=(-half_h + tf, half_b)))
+    segments.append(Line(start=(-half_h, half_b), end=(-y_in, half_b)))
     
     # Inner profile (going back up)
     if use_inner_fillet:
         # 7. Bottom flange inner: to near corner
-        segments.append(Line(start=(-half_h + tf, half_b), end=(-half_h + tf, -half_b + r)))
+        segments.append(Line(start=(-y_in, half_b), end=(-y_in, z_c)))
         
         # 8. Bottom-Left inner corner arc (concave, going CW in local sense)
-        cy = -half_h + r
-        cz = -half_b + r
-        segments.append(Arc(center=(cy, cz), radius=ri, start_angle=3*math.pi/2, end_angle=math.pi))
+        segments.append(Arc(center=(-y_c, z_c), radius=ri, start_angle=THREE_HALF_PI, end_angle=PI))
         
         # 9. Left web inner edge (going up)
-        segments.append(Line(start=(-half_h + r, -half_b + tw), end=(half_h - r, -half_b + tw)))
+        segments.append(Line(start=(-y_c, z_web), end=(y_c, z_web)))
         
         # 10. Top-Left inner corner arc
-        cy = half_h - r
-        cz = -half_b + r
-        segments.append(Arc(center=(cy, cz), radius=ri, start_angle=math.pi, end_angle=math.pi/2))
+        segments.append(Arc(center=(y_c, z_c), radius=ri, start_angle=PI, end_angle=HALF_PI))
         
         # 11. Top flange inner: from corner to tip
-        segments.append(Line(start=(half_h - tf, -half_b + r), end=(half_h - tf, half_b)))
+        segments.append(Line(start=(y_in, z_c), end=(y_in, half_b)))
     else:
         # Sharp inner corners
-        segments.append(Line(start=(-half_h + tf, half_b), end=(-half_h + tf, -half_b + tw)))
-        segments.append(Line(start=(-half_h + tf, -half_b + tw), end=(half_h - tf, -half_b + tw)))
-        segments.append(Line(start=(half_h - tf, -half_b + tw), end=(half_h - tf, half_b)))
+        segments.append(Line(start=(-y_in, half_b), end=(-y_in, z_web)))
+        segments.append(Line(start=(-y_in, z_web), end=(y_in, z_web)))
+        segments.append(Line(start=(y_in, z_web), end=(y_in, half_b)))
     
     # 12. Top-Right tip: inner to outer (closing)
-    segments.append(Line(start=(half_h - tf, half_b), end=(half_h, half_b)))
+    segments.append(Line(start=(y_in, half_b), end=(half_h, half_b)))
     
     contour = Contour(segments=segments, hollow=False)
     geom = Geometry(contours=[contour])
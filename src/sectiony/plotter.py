@@ -1,18 +1,81 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Optional, List, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, List, Tuple, Union
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.path import Path
-from matplotlib.patches import PathPatch
-import math
+from matplotlib.collections import PathCollection
+
+from .geometry import Line, Arc, CubicBezier, _clip_polygon, _orient_ccw, _polygon_area_signed
 
 if TYPE_CHECKING:
     from .section import Section
-    from .geometry import Contour, Line, Arc, CubicBezier
+    from .geometry import Contour
 
 # Type alias for points
 Point = Tuple[float, float]
 
 
+def _emit_line(segment: Line, vertices: np.ndarray, codes: np.ndarray, i: int) -> int:
+    """Line: just LINETO to end point."""
+    vertices[i] = (segment.end[1], segment.end[0])
+    codes[i] = Path.LINETO
+    return i + 1
+
+
+@lru_cache(maxsize=1024)
+def _arc_curve_vertices(segment: Arc) -> np.ndarray:
+    """
+    CURVE4 vertices (control1, control2, end per cubic) of an arc's Bezier
+    approximation in plot coords, cached per arc (arcs are immutable and,
+    with coordinates normalised to float tuples, hash by value).
+    """
+    verts = np.array([
+        ((bez.p1[1], bez.p1[0]), (bez.p2[1], bez.p2[0]), (bez.p3[1], bez.p3[0]))
+        for bez in segment.beziers
+    ], dtype=np.float64).reshape(-1, 2)
+    verts.flags.writeable = False
+    return verts
+
+
+def _emit_arc(segment: Arc, vertices: np.ndarray, codes: np.ndarray, i: int) -> int:
+    """Arc as bezier curves for native rendering (codes are pre-filled with CURVE4)."""
+    verts = _arc_curve_vertices(segment)
+    vertices[i:i + len(verts)] = verts
+    return i + len(verts)
+
+
+def _emit_bezier(segment: CubicBezier, vertices: np.ndarray, codes: np.ndarray, i: int) -> int:
+    """Native cubic bezier (codes are pre-filled with CURVE4)."""
+    vertices[i:i + 3] = (
+        (segment.p1[1], segment.p1[0]),
+        (segment.p2[1], segment.p2[0]),
+        (segment.p3[1], segment.p3[0]),
+    )
+    return i + 3
+
+
+# Per-segment-type (vertex count, emitter), dispatched on the exact type
+_SEGMENT_EMIT = {
+    Line: (lambda segment: 1, _emit_line),
+    Arc: (lambda segment: len(_arc_curve_vertices(segment)), _emit_arc),
+    CubicBezier: (lambda segment: 3, _emit_bezier),
+}
+
+
+def _segment_handler(segment) -> Optional[tuple]:
+    """
+    (vertex count, emitter) for a segment: looked up by exact type, falling
+    back to isinstance for subclasses of the segment types. None if unknown.
+    """
+    handler = _SEGMENT_EMIT.get(type(segment))
+    if handler is None:
+        for kind, candidate in _SEGMENT_EMIT.items():
+            if isinstance(segment, kind):
+                return candidate
+    return handler
+
+
 def contour_to_path(contour: 'Contour') -> Optional[Path]:
     """
     Convert a Contour to a matplotlib Path with native curve commands.
@@ -26,113 +89,131 @@ def contour_to_path(contour: 'Contour') -> Optional[Path]:
     Returns:
         A matplotlib Path, or None if contour has no segments
     """
-    from .geometry import Line, Arc, CubicBezier
-    
     if not contour.segments:
         return None
     
-    vertices: List[tuple[float, float]] = []
-    codes: List[int] = []
+    # Size the vertex/code arrays up front: one vertex per line, three
+    # (control, control, end) per cubic, arcs being a run of cubics.
+    # Unknown segment types are skipped.
+    handlers = [_segment_handler(segment) for segment in contour.segments]
+    n_verts = 2  # MOVETO + CLOSEPOLY
+    for segment, handler in zip(contour.segments, handlers):
+        if handler is not None:
+            n_verts += handler[0](segment)
+    
+    vertices = np.empty((n_verts, 2), dtype=np.float64)
+    codes = np.full(n_verts, Path.CURVE4, dtype=Path.code_type)
     
     # Start with MOVETO to first point
     first_segment = contour.segments[0]
     if isinstance(first_segment, Line):
         start_point = first_segment.start
     elif isinstance(first_segment, Arc):
-        cy, cz = first_segment.center
-        y = cy + first_segment.radius * math.sin(first_segment.start_angle)
-        z = cz + first_segment.radius * math.cos(first_segment.start_angle)
-        start_point = (y, z)
+        # Same point as start_point(), read from the cached Bezier split
+        # that the arc is emitted from anyway
+        start_point = first_segment.beziers[0].p0
     elif isinstance(first_segment, CubicBezier):
         start_point = first_segment.p0
     else:
         start_point = (0, 0)
     
     # Convert (y, z) to plot coords (z, y) - z horizontal, y vertical
-    vertices.append((start_point[1], start_point[0]))
-    codes.append(Path.MOVETO)
-    
-    for segment in contour.segments:
-        if isinstance(segment, Line):
-            # Line: just LINETO to end point
-            vertices.append((segment.end[1], segment.end[0]))
-            codes.append(Path.LINETO)
-            
-        elif isinstance(segment, Arc):
-            # Convert arc to bezier curves for native rendering
-            beziers = segment.to_beziers()
-            for bez in beziers:
-                # CURVE4 needs 3 vertices: control1, control2, end
-                vertices.append((bez.p1[1], bez.p1[0]))
-                codes.append(Path.CURVE4)
-                vertices.append((bez.p2[1], bez.p2[0]))
-                codes.append(Path.CURVE4)
-                vertices.append((bez.p3[1], bez.p3[0]))
-                codes.append(Path.CURVE4)
-                
-        elif isinstance(segment, CubicBezier):
-            # Native cubic bezier
-            vertices.append((segment.p1[1], segment.p1[0]))
-            codes.append(Path.CURVE4)
-            vertices.append((segment.p2[1], segment.p2[0]))
-            codes.append(Path.CURVE4)
-            vertices.append((segment.p3[1], segment.p3[0]))
-            codes.append(Path.CURVE4)
-    
-    # Close the path
-    codes.append(Path.CLOSEPOLY)
-    vertices.append(vertices[0])  # Close back to start
-    
-    return Path(vertices, codes)
-
-
-def points_to_path(points: List[Point]) -> Optional[Path]:
+    vertices[0] = (start_point[1], start_point[0])
+    codes[0] = Path.MOVETO
+    
+    i = 1
+    for segment, handler in zip(contour.segments, handlers):
+        if handler is not None:
+            i = handler[1](segment, vertices, codes, i)
+    
+    # Close the path. When the contour ends with a line back onto its start,
+    # that line becomes the CLOSEPOLY itself instead of being followed by a
+    # zero-length closing segment. (CLOSEPOLY's own vertex is ignored when
+    # drawing; the start point is kept there so the path extents stay exact.)
+    last = i - 1
+    if (
+        codes[last] == Path.LINETO
+        and abs(vertices[last, 0] - vertices[0, 0]) < 1e-9
+        and abs(vertices[last, 1] - vertices[0, 1]) < 1e-9
+    ):
+        i = last
+    codes[i] = Path.CLOSEPOLY
+    vertices[i] = vertices[0]
+    
+    return Path(vertices[:i + 1], codes[:i + 1])
+
+
+def points_to_path(points: Union[List[Point], np.ndarray]) -> Optional[Path]:
     """
     Convert a list of points to a matplotlib Path (polygon).
     
     Args:
-        points: List of (y, z) points
+        points: List of (y, z) points, or an (N, 2) array
         
     Returns:
         A matplotlib Path, or None if fewer than 3 points
     """
-    if not points or len(points) < 3:
+    n = len(points)
+    if n < 3:
         return None
     
-    # Convert (y, z) to plot coords (z, y)
-    vertices = [(p[1], p[0]) for p in points]
-    vertices.append(vertices[0])  # Close
-    codes = [Path.MOVETO] + [Path.LINETO] * (len(points) - 1) + [Path.CLOSEPOLY]
+    pts = np.asarray(points, dtype=np.float64)
+    # An explicit repeat of the start point would only add a zero-length
+    # edge before the close; its slot becomes the CLOSEPOLY vertex instead
+    if n > 3 and pts[-1, 0] == pts[0, 0] and pts[-1, 1] == pts[0, 1]:
+        n -= 1
+    
+    # Convert (y, z) to plot coords (z, y). closed=True makes the last
+    # vertex the CLOSEPOLY, whose position is ignored when drawing; the
+    # start point is kept there so the path extents stay exact
+    vertices = np.empty((n + 1, 2), dtype=np.float64)
+    vertices[:n] = pts[:n, ::-1]
+    vertices[n] = vertices[0]
     
-    return Path(vertices, codes)
+    return Path(vertices, closed=True)
+
+
+def _solid_clippers(solids: List['Contour']) -> List[np.ndarray]:
+    """
+    Discretize solid contours once into counter-clockwise point arrays,
+    ready to clip any number of hollows against.
+    """
+    return [_orient_ccw(contour.discretize_xy()) for contour in solids]
 
 
 def _clip_hollow_to_solids(
-    hollow_points: List[Point], 
-    solid_contours: List['Contour']
-) -> List[List[Point]]:
+    hollow_points: Union[List[Point], np.ndarray], 
+    solid_points: List[np.ndarray]
+) -> List[np.ndarray]:
     """
     Clip a hollow contour to only the parts that intersect with solid regions.
     
     Args:
-        hollow_points: Discretized points of the hollow contour
-        solid_contours: List of solid contours to clip against
+        hollow_points: Discretized points of the hollow contour, as a list
+            or an (N, 2) array
+        solid_points: Discretized (N, 2) point arrays of the solid contours
+            to clip against, each oriented counter-clockwise (see
+            ``_solid_clippers``)
         
     Returns:
-        List of clipped point lists (one for each solid intersection)
+        List of clipped (N, 2) point arrays (one for each solid intersection)
     """
-    # Import clipping functions from geometry module
-    from .geometry import _clip_polygon, _polygon_area_signed
-    
     clipped_regions = []
     
-    for solid in solid_contours:
-        solid_points = solid.discretize()
-        if len(solid_points) < 3:
+    hollow_arr = np.asarray(hollow_points, dtype=np.float64)
+    lo = hollow_arr.min(axis=0)
+    hi = hollow_arr.max(axis=0)
+    
+    for pts in solid_points:
+        if len(pts) < 3:
+            continue
+        
+        # Disjoint bounding boxes cannot intersect
+        if (pts.max(axis=0) < lo).any() or (pts.min(axis=0) > hi).any():
             continue
             
         # Clip hollow to this solid
-        clipped = _clip_polygon(hollow_points, solid_points)
+        clipped = _clip_polygon(hollow_points, pts)
         
         # Only keep if it has area (actual intersection)
         if len(clipped) >= 3 and abs(_polygon_area_signed(clipped)) > 1e-9:
@@ -170,67 +251,71 @@ def plot_section(
     solids = [c for c in section.geometry.contours if not c.hollow]
     hollows = [c for c in section.geometry.contours if c.hollow]
     
-    all_z: List[float] = []
-    all_y: List[float] = []
+    # Point arrays of everything drawn, reduced once for the axis limits
+    all_pts: List[np.ndarray] = []
+    solid_paths: List[Path] = []
+    hollow_paths: List[Path] = []
+    
+    # Discretize each solid once; the points serve both the axis limits and
+    # the clipping of every hollow
+    solid_points = _solid_clippers(solids)
     
     # Plot solids
-    for contour in solids:
+    for contour, pts in zip(solids, solid_points):
         path = contour_to_path(contour)
         if path is None:
             continue
         
         # Collect bounds from discretized points
-        points = contour.discretize()
-        for p in points:
-            all_y.append(p[0])
-            all_z.append(p[1])
-        
-        patch = PathPatch(path, facecolor='silver', edgecolor='black', 
-                         alpha=0.8, linewidth=1.0)
-        ax.add_patch(patch)
+        all_pts.append(pts)
+        solid_paths.append(path)
     
     # Plot hollows - clipped to solid regions
     for contour in hollows:
-        hollow_points = contour.discretize()
+        hollow_points = contour.discretize_xy()
         if len(hollow_points) < 3:
             continue
         
         # Clip hollow to solid regions
-        clipped_regions = _clip_hollow_to_solids(hollow_points, solids)
+        clipped_regions = _clip_hollow_to_solids(hollow_points, solid_points)
         
         for clipped_points in clipped_regions:
             # Collect bounds from clipped points
-            for p in clipped_points:
-                all_y.append(p[0])
-                all_z.append(p[1])
+            all_pts.append(clipped_points)
             
             # Create path from clipped polygon
             path = points_to_path(clipped_points)
             if path is None:
                 continue
-            
-            patch = PathPatch(path, facecolor='white', edgecolor='black',
-                             linestyle='--', alpha=1.0, linewidth=1.0)
-            ax.add_patch(patch)
+            hollow_paths.append(path)
+    
+    # One collection per style rather than an artist per region; hollows are
+    # added last so they paint over the solids. Limits are set from the
+    # collected points below, so matplotlib's data limit update is skipped
+    if solid_paths:
+        ax.add_collection(PathCollection(
+            solid_paths, facecolors='silver', edgecolors='black',
+            alpha=0.8, linewidths=1.0
+        ), autolim=False)
+    if hollow_paths:
+        ax.add_collection(PathCollection(
+            hollow_paths, facecolors='white', edgecolors='black',
+            linestyles='--', alpha=1.0, linewidths=1.0
+        ), autolim=False)
         
     # Set limits and aspect
-    if all_z and all_y:
-        z_min, z_max = min(all_z), max(all_z)
-        y_min, y_max = min(all_y), max(all_y)
-        
-        dz = z_max - z_min
-        dy = y_max - y_min
-        
-        if dz == 0:
-            dz = 1.0
-        if dy == 0:
-            dy = 1.0
-        
-        padding_z = dz * 0.1
-        padding_y = dy * 0.1
+    pts = np.concatenate(all_pts) if all_pts else np.empty((0, 2))
+    if len(pts):
+        mins = pts.min(axis=0)
+        maxs = pts.max(axis=0)
+        spans = maxs - mins
+        pad = np.where(spans == 0, 1.0, spans) * 0.1
+        lo = mins - pad
+        hi = maxs + pad
         
-        ax.set_xlim(z_min - padding_z, z_max + padding_z)
-        ax.set_ylim(y_min - padding_y, y_max + padding_y)
+        # Columns are (y, z); plot z horizontally and y vertically
+        ax.set_xlim(lo[1], hi[1])
+        ax.set_ylim(lo[0], hi[0])
         ax.set_aspect('equal')
     
     ax.set_xlabel('z')
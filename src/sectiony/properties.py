@@ -1,12 +1,17 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import numpy as np
 import math
 
+from .utils import bbox_window, scanline_fill
+
 # Type alias for points
 Point = Tuple[float, float]
 
+# Discretized contour: (N, 2) array of (y, z) points and its hollow flag
+ContourPoints = Tuple[np.ndarray, bool]
+
 
 @dataclass
 class SectionProperties:
@@ -33,12 +38,18 @@ class SectionProperties:
     SCz: float = 0.0  # Shear center z-coordinate
 
 
-def calculate_exact_properties(contours: List[Tuple[List[Point], bool]]) -> SectionProperties:
+def calculate_exact_properties(
+    contours: List[ContourPoints],
+    moments: Optional[List[Optional[np.ndarray]]] = None
+) -> SectionProperties:
     """
     Calculate exact geometric properties (Area, Centroids, Inertia) using Green's Theorem.
     
     Args:
-        contours: List of (points, hollow) tuples
+        contours: List of (points, hollow) tuples with (N, 2) point arrays
+        moments: Optional per-contour (A, ∫y dA, ∫z dA, ∫y² dA, ∫z² dA,
+            ∫yz dA), e.g. integrated along curved segments; used in place of
+            the polygon sums for the contours where given
         
     Returns:
         SectionProperties with exact values calculated
@@ -52,54 +63,25 @@ def calculate_exact_properties(contours: List[Tuple[List[Point], bool]]) -> Sect
     
     valid_contours = False
 
-    for pts, hollow in contours:
-        if not pts or len(pts) < 3:
+    if moments is None:
+        moments = [None] * len(contours)
+
+    for (pts, hollow), exact in zip(contours, moments):
+        if len(pts) < 3:
             continue
         
         valid_contours = True
         
-        # Ensure closed polygon
-        pts_closed = list(pts)
-        if pts[0] != pts[-1]:
-            pts_closed.append(pts[0])
-            
-        A_poly = 0.0
-        Qz_poly = 0.0
-        Qy_poly = 0.0
-        Izz_poly = 0.0
-        Iyy_poly = 0.0
-        Iyz_poly = 0.0
-        
-        for i in range(len(pts_closed) - 1):
-            yi, zi = pts_closed[i]
-            yj, zj = pts_closed[i+1]
-            
-            det = yi * zj - zi * yj
-            
-            A_poly += det
-            Qz_poly += (yi + yj) * det
-            Qy_poly += (zi + zj) * det
-            Izz_poly += (yi**2 + yi*yj + yj**2) * det
-            Iyy_poly += (zi**2 + zi*zj + zj**2) * det
-            Iyz_poly += (yi*zj + 2*yi*zi + 2*yj*zj + yj*zi) * det
-
-        A_poly *= 0.5
-        Qz_poly /= 6.0
-        Qy_poly /= 6.0
-        Izz_poly /= 12.0
-        Iyy_poly /= 12.0
-        Iyz_poly /= 24.0
+        if exact is not None:
+            A_poly, Qz_poly, Qy_poly, Izz_poly, Iyy_poly, Iyz_poly = exact.tolist()
+        else:
+            A_poly, Qz_poly, Qy_poly, Izz_poly, Iyy_poly, Iyz_poly = _polygon_moments(pts)
         
-        # Enforce positive area for calculation logic, then apply sign based on hollow flag
-        if A_poly < 0:
-            A_poly = -A_poly
-            Qz_poly = -Qz_poly
-            Qy_poly = -Qy_poly
-            Izz_poly = -Izz_poly
-            Iyy_poly = -Iyy_poly
-            Iyz_poly = -Iyz_poly
-            
-        sign = -1.0 if hollow else 1.0
+        # Enforce positive area for calculation logic, then apply sign based
+        # on hollow flag; both folded into one multiplier
+        sign = math.copysign(1.0, A_poly)
+        if hollow:
+            sign = -sign
         
         A_total += sign * A_poly
         Qz_total += sign * Qz_poly
@@ -125,18 +107,12 @@ def calculate_exact_properties(contours: List[Tuple[List[Point], bool]]) -> Sect
     rz = math.sqrt(Iz_c / A_total) if A_total > 0 and Iz_c > 0 else 0.0
     
     # Extreme fibers (relative to Centroid)
-    y_max = 0.0
-    z_max = 0.0
-    
-    for pts, _ in contours:
-        # Check all points, even for hollow contours, to find bounds
-        for yi, zi in pts:
-            dy = abs(yi - Cy)
-            dz = abs(zi - Cz)
-            if dy > y_max:
-                y_max = dy
-            if dz > z_max:
-                z_max = dz
+    # Check all points, even for hollow contours, to find bounds
+    all_pts = _stack_points(contours)
+    if len(all_pts):
+        y_max, z_max = np.abs(all_pts - (Cy, Cz)).max(axis=0).tolist()
+    else:
+        y_max = z_max = 0.0
             
     # Section Moduli
     Sy = Iy_c / z_max if z_max > 1e-9 else 0.0
@@ -150,10 +126,45 @@ def calculate_exact_properties(contours: List[Tuple[List[Point], bool]]) -> Sect
     )
 
 
+def _polygon_moments(pts: np.ndarray) -> Tuple[float, float, float, float, float, float]:
+    """
+    Area moments (A, ∫y dA, ∫z dA, ∫y² dA, ∫z² dA, ∫yz dA) of a polygon,
+    signed by winding.
+    """
+    # Ensure closed polygon
+    arr = np.asarray(pts, dtype=np.float64)
+    if (arr[0] != arr[-1]).any():
+        arr = np.vstack((arr, arr[:1]))
+    
+    # Green's theorem edge terms for all edges (i -> j) at once
+    yi = arr[:-1, 0]
+    zi = arr[:-1, 1]
+    yj = arr[1:, 0]
+    zj = arr[1:, 1]
+    det = yi * zj - zi * yj
+    
+    A_poly = float(det.sum())
+    Qz_poly = float(np.dot(yi + yj, det))
+    Qy_poly = float(np.dot(zi + zj, det))
+    Izz_poly = float(np.dot(yi * yi + yi * yj + yj * yj, det))
+    Iyy_poly = float(np.dot(zi * zi + zi * zj + zj * zj, det))
+    Iyz_poly = float(np.dot(yi * zj + 2 * yi * zi + 2 * yj * zj + yj * zi, det))
+    
+    return (
+        A_poly * 0.5,
+        Qz_poly / 6.0,
+        Qy_poly / 6.0,
+        Izz_poly / 12.0,
+        Iyy_poly / 12.0,
+        Iyz_poly / 24.0,
+    )
+
+
 def calculate_grid_properties(
     props: SectionProperties, 
-    contours: List[Tuple[List[Point], bool]], 
-    resolution: int = 100
+    contours: List[ContourPoints], 
+    resolution: int = 100,
+    J: Optional[float] = None
 ) -> None:
     """
     Calculate properties requiring grid discretization (J, Zpl, Shear Center).
@@ -163,20 +174,16 @@ def calculate_grid_properties(
         props: SectionProperties object to update
         contours: List of (points, hollow) tuples
         resolution: Grid resolution
+        J: Known closed-form torsion constant; when given, the Poisson
+            solve for J is skipped
     """
-    from matplotlib.path import Path
-
-    all_points: List[Point] = []
-    for pts, _ in contours:
-        all_points.extend(pts)
+    all_points = _stack_points(contours)
     
-    if not all_points:
+    if not len(all_points):
         return
 
-    ys = [p[0] for p in all_points]
-    zs = [p[1] for p in all_points]
-    y_min, y_max_coord = min(ys), max(ys)
-    z_min, z_max_coord = min(zs), max(zs)
+    y_min, z_min = all_points.min(axis=0).tolist()
+    y_max_coord, z_max_coord = all_points.max(axis=0).tolist()
     
     height = y_max_coord - y_min
     width = z_max_coord - z_min
@@ -197,41 +204,46 @@ def calculate_grid_properties(
     ny = int((height + 2*padding) / h)
     nz = int((width + 2*padding) / h)
     
-    # Create meshgrid coordinates
+    # Grid coordinates
     y_vals = np.linspace(y0, y0 + (ny-1)*h, ny)
     z_vals = np.linspace(z0, z0 + (nz-1)*h, nz)
     
-    Y, Z = np.meshgrid(y_vals, z_vals, indexing='ij')
-    pts_flat = np.column_stack((Y.ravel(), Z.ravel()))
-    
-    # Create mask using matplotlib Path
-    is_solid = np.zeros(len(pts_flat), dtype=bool)
+    # Rasterize each contour onto the grid cells inside its bounding box
+    mask = np.zeros((ny, nz), dtype=bool)
     for pts, hollow in contours:
         if hollow or len(pts) < 3:
             continue
-        path = Path(pts)
-        is_solid |= path.contains_points(pts_flat)
+        arr = np.asarray(pts, dtype=np.float64)
+        rows, cols = bbox_window(arr, y_vals, z_vals)
+        mask[rows, cols] |= scanline_fill(arr, y_vals[rows], z_vals[cols])
         
-    is_hole = np.zeros(len(pts_flat), dtype=bool)
+    is_hole = np.zeros((ny, nz), dtype=bool)
     for pts, hollow in contours:
         if not hollow or len(pts) < 3:
             continue
-        path = Path(pts)
-        is_hole |= path.contains_points(pts_flat)
+        arr = np.asarray(pts, dtype=np.float64)
+        rows, cols = bbox_window(arr, y_vals, z_vals)
+        # Holes that do not overlap any solid cell cannot change the mask
+        if not mask[rows, cols].any():
+            continue
+        is_hole[rows, cols] |= scanline_fill(arr, y_vals[rows], z_vals[cols])
         
-    final_mask_flat = is_solid & (~is_hole)
-    mask = final_mask_flat.reshape((ny, nz))
+    mask &= ~is_hole
     
     dA = h * h
     
     # --- Torsion Constant J ---
-    # Solve Poisson equation: del^2 phi = -2 inside, phi = 0 on boundary
-    from .utils import solve_poisson_jacobi
-    
-    phi = solve_poisson_jacobi(mask, h)
-    
-    # J = 2 * Volume under phi
-    props.J = 2.0 * np.sum(phi) * dA
+    if J is not None:
+        props.J = J
+    else:
+        # Solve Poisson equation: del^2 phi = -2 inside, phi = 0 on boundary
+        from .utils import solve_poisson_sor
+        
+        # Single precision is well inside the grid's discretization error
+        phi = solve_poisson_sor(mask, h, dtype=np.float32)
+        
+        # J = 2 * Volume under phi, accumulated in double precision
+        props.J = 2.0 * float(np.sum(phi, dtype=np.float64)) * dA
     
     # --- Plastic Section Modulus Zpl ---
     # Zpl = Integral |u - PNA| dA
@@ -240,21 +252,17 @@ def calculate_grid_properties(
     rows, cols = np.where(mask)
     if len(rows) == 0:
         return
-        
-    y_coords = y_vals[rows]
-    z_coords = z_vals[cols]
+    
+    # The PNA is the median coordinate. Every cell in a grid row shares its
+    # y (and every cell in a column its z), so both the median and the
+    # first moment about it follow from the per-row and per-column cell
+    # counts, without selecting or differencing per cell
     
     # Zpl_z (Bending about z-axis / vertical bending -> PNA is y = const)
-    sorted_y = np.sort(y_coords)
-    mid_idx = len(sorted_y) // 2
-    pna_y = sorted_y[mid_idx]
-    props.Zpl_z = np.sum(np.abs(y_coords - pna_y)) * dA
+    props.Zpl_z = _plastic_first_moment(np.count_nonzero(mask, axis=1), y_vals) * dA
     
     # Zpl_y (Bending about y-axis / horizontal bending -> PNA is z = const)
-    sorted_z = np.sort(z_coords)
-    mid_idx = len(sorted_z) // 2
-    pna_z = sorted_z[mid_idx]
-    props.Zpl_y = np.sum(np.abs(z_coords - pna_z)) * dA
+    props.Zpl_y = _plastic_first_moment(np.count_nonzero(mask, axis=0), z_vals) * dA
     
     # --- Shear Center ---
     _calculate_shear_center(props, contours)
@@ -274,10 +282,10 @@ def calculate_grid_properties(
         w0 = w - w_mean
         
         # Calculate warping moments
-        # The coordinates y, z are already available for mask points in y_coords, z_coords
-        # Relative to centroid
-        y_c = y_coords - props.Cy
-        z_c = z_coords - props.Cz
+        # Coordinates of the mask points relative to centroid, shifting the
+        # grid axes once and gathering, rather than shifting every point
+        y_c = (y_vals - props.Cy)[rows]
+        z_c = (z_vals - props.Cz)[cols]
         
         Iw_z = np.sum(w0 * z_c) * dA  # Integral w0 * z dA
         Iw_y = np.sum(w0 * y_c) * dA  # Integral w0 * y dA
@@ -299,9 +307,28 @@ def calculate_grid_properties(
         props.Cw = np.sum(wn**2) * dA
 
 
+def _plastic_first_moment(counts: np.ndarray, coords: np.ndarray) -> float:
+    """
+    Sum of |u - PNA| over the grid cells, given the number of cells at each
+    grid coordinate u; the PNA is the median cell coordinate.
+    """
+    cumulative = np.cumsum(counts)
+    # Coordinate of the cell at sorted index total // 2
+    pna = coords[np.searchsorted(cumulative, cumulative[-1] // 2, side='right')]
+    return float(np.dot(counts, np.abs(coords - pna)))
+
+
+def _stack_points(contours: List[ContourPoints]) -> np.ndarray:
+    """All contour points (hollow or not) stacked into one (N, 2) array."""
+    arrays = [np.asarray(pts, dtype=np.float64) for pts, _ in contours if len(pts)]
+    if not arrays:
+        return np.empty((0, 2), dtype=np.float64)
+    return np.concatenate(arrays)
+
+
 def _calculate_shear_center(
     props: SectionProperties, 
-    contours: List[Tuple[List[Point], bool]]
+    contours: List[ContourPoints]
 ) -> None:
     """
     Calculate shear center using numerical methods.
@@ -320,12 +347,9 @@ def _calculate_shear_center(
     A = props.A
     
     # Collect all boundary points for symmetry analysis
-    all_points: List[Point] = []
-    for pts, hollow in contours:
-        if not hollow and len(pts) >= 3:
-            all_points.extend(pts)
+    solid_pts = [pts for pts, hollow in contours if not hollow and len(pts) >= 3]
     
-    if not all_points:
+    if not solid_pts:
         props.SCy = Cy
         props.SCz = Cz
         return
@@ -335,36 +359,26 @@ def _calculate_shear_center(
     # S_yyy = ∫y³dA indicates asymmetry about z-axis (affects SC_y)
     # S_zzz = ∫z³dA indicates asymmetry about y-axis (affects SC_z)
     
-    # Use boundary points to estimate third moments
-    n = len(all_points)
-    S_yyy = 0.0  # Third moment in y
-    S_zzz = 0.0  # Third moment in z
-    S_yyz = 0.0  # Mixed third moment
-    S_yzz = 0.0  # Mixed third moment
-    
-    # Use Green's theorem-like approach for third moments
-    for i in range(n):
-        j = (i + 1) % n
-        yi, zi = all_points[i]
-        yj, zj = all_points[j]
-        
-        # Relative to centroid
-        yi_c, zi_c = yi - Cy, zi - Cz
-        yj_c, zj_c = yj - Cy, zj - Cz
-        
-        # Cross product (for area element direction)
-        det = yi_c * zj_c - yj_c * zi_c
-        
-        # Third moment contributions (approximate using polygon vertices)
-        S_yyy += (yi_c**3 + yi_c**2*yj_c + yi_c*yj_c**2 + yj_c**3) * det
-        S_zzz += (zi_c**3 + zi_c**2*zj_c + zi_c*zj_c**2 + zj_c**3) * det
-        S_yyz += (yi_c**2 + yi_c*yj_c + yj_c**2) * (zi_c + zj_c) * det
-        S_yzz += (zi_c**2 + zi_c*zj_c + zj_c**2) * (yi_c + yj_c) * det
+    # Use boundary points to estimate third moments, via a Green's
+    # theorem-like sum over all edges (i -> i+1, wrapping) at once
+    arr = np.concatenate(solid_pts).astype(np.float64, copy=False)
+    
+    # Relative to centroid
+    yi_c = arr[:, 0] - Cy
+    zi_c = arr[:, 1] - Cz
+    yj_c = np.roll(yi_c, -1)
+    zj_c = np.roll(zi_c, -1)
+    
+    # Cross product (for area element direction)
+    det = yi_c * zj_c - yj_c * zi_c
+    
+    # Third moment contributions (approximate using polygon vertices).
+    # Only the pure moments decide symmetry; the mixed ones are not needed.
+    S_yyy = float(np.dot((yi_c + yj_c) * (yi_c * yi_c + yj_c * yj_c), det))  # Third moment in y
+    S_zzz = float(np.dot((zi_c + zj_c) * (zi_c * zi_c + zj_c * zj_c), det))  # Third moment in z
     
     S_yyy /= 20.0
     S_zzz /= 20.0
-    S_yyz /= 24.0
-    S_yzz /= 24.0
     
     # Characteristic length for symmetry tolerance
     char_length = math.sqrt(A) if A > 0 else 1.0
@@ -386,7 +400,7 @@ def _calculate_shear_center(
         # Symmetric about z-axis (horizontal) - SC_y = Cy
         props.SCy = Cy
         # Need to compute SC_z offset using sectorial method
-        e_z = _compute_shear_center_offset_z(all_points, Cy, Cz, Iy, Iz, Iyz)
+        e_z = _compute_shear_center_offset_z(arr, Cy, Cz, Iy, Iz, Iyz)
         props.SCz = Cz + e_z
         return
     
@@ -394,18 +408,18 @@ def _calculate_shear_center(
         # Symmetric about y-axis (vertical) - SC_z = Cz  
         props.SCz = Cz
         # Need to compute SC_y offset using sectorial method
-        e_y = _compute_shear_center_offset_y(all_points, Cy, Cz, Iy, Iz, Iyz)
+        e_y = _compute_shear_center_offset_y(arr, Cy, Cz, Iy, Iz, Iyz)
         props.SCy = Cy + e_y
         return
     
     # Asymmetric section - use full sectorial calculation
-    e_y, e_z = _compute_shear_center_offsets(all_points, Cy, Cz, Iy, Iz, Iyz)
+    e_y, e_z = _compute_shear_center_offsets(arr, Cy, Cz, Iy, Iz, Iyz)
     props.SCy = Cy + e_y
     props.SCz = Cz + e_z
 
 
 def _compute_shear_center_offsets(
-    points: List[Point], 
+    points: np.ndarray, 
     Cy: float, Cz: float,
     Iy: float, Iz: float, Iyz: float
 ) -> Tuple[float, float]:
@@ -417,48 +431,40 @@ def _compute_shear_center_offsets(
     if n < 3:
         return 0.0, 0.0
     
-    # Compute sectorial coordinates and segment lengths
-    omega = [0.0] * n
-    ds_list: List[float] = []
-    
-    for i in range(n):
-        j = (i + 1) % n
-        yi, zi = points[i]
-        yj, zj = points[j]
-        
-        ds = math.sqrt((yj - yi)**2 + (zj - zi)**2)
-        ds_list.append(ds)
-        
-        ri_y, ri_z = yi - Cy, zi - Cz
-        rj_y, rj_z = yj - Cy, zj - Cz
-        
-        d_omega = ri_y * rj_z - ri_z * rj_y
-        if j > 0:
-            omega[j] = omega[i] + d_omega
-    
-    # Normalize sectorial coordinates
-    total_perimeter = sum(ds_list)
+    # Edges i -> j = i + 1 (wrapping), relative to the centroid
+    ri_y = points[:, 0] - Cy
+    ri_z = points[:, 1] - Cz
+    rj_y = np.roll(ri_y, -1)
+    rj_z = np.roll(ri_z, -1)
+    
+    # Compute sectorial coordinates and segment lengths: omega accumulates
+    # the swept area along the boundary, starting from 0 at the first point.
+    # It varies linearly along each edge, from omega_i to omega_i + d_omega
+    # (the closing edge runs on to the full swept area, not back to 0)
+    ds = np.hypot(rj_y - ri_y, rj_z - ri_z)
+    d_omega = ri_y * rj_z - ri_z * rj_y
+    omega_i = np.empty(n)
+    omega_i[0] = 0.0
+    np.cumsum(d_omega[:-1], out=omega_i[1:])
+    omega_j = omega_i + d_omega
+    
+    # Normalize sectorial coordinates (mean over the boundary is exact for
+    # a linear omega)
+    total_perimeter = float(ds.sum())
     if total_perimeter > 1e-9:
-        omega_ds_sum = sum(0.5 * (omega[i] + omega[(i+1) % n]) * ds_list[i] for i in range(n))
-        omega_mean = omega_ds_sum / total_perimeter
-        omega = [w - omega_mean for w in omega]
-    
-    # Compute sectorial products
-    I_omega_y = 0.0
-    I_omega_z = 0.0
-    
-    for i in range(n):
-        j = (i + 1) % n
-        yi, zi = points[i]
-        yj, zj = points[j]
-        
-        omega_avg = 0.5 * (omega[i] + omega[j])
-        y_avg = 0.5 * (yi + yj) - Cy
-        z_avg = 0.5 * (zi + zj) - Cz
-        ds = ds_list[i]
-        
-        I_omega_y += omega_avg * y_avg * ds
-        I_omega_z += omega_avg * z_avg * ds
+        omega_mean = 0.5 * float(np.dot(omega_i + omega_j, ds)) / total_perimeter
+        omega_i -= omega_mean
+        omega_j -= omega_mean
+    
+    # Compute sectorial products, integrating the product of the two linear
+    # functions exactly along each edge, so the result does not depend on
+    # how finely straight edges are sampled
+    I_omega_y = float(np.dot(
+        2.0 * (omega_i * ri_y + omega_j * rj_y) + omega_i * rj_y + omega_j * ri_y, ds
+    )) / 6.0
+    I_omega_z = float(np.dot(
+        2.0 * (omega_i * ri_z + omega_j * rj_z) + omega_i * rj_z + omega_j * ri_z, ds
+    )) / 6.0
     
     # Compute offsets
     det = Iy * Iz - Iyz * Iyz
@@ -474,7 +480,7 @@ def _compute_shear_center_offsets(
 
 
 def _compute_shear_center_offset_y(
-    points: List[Point],
+    points: np.ndarray,
     Cy: float, Cz: float,
     Iy: float, Iz: float, Iyz: float
 ) -> float:
@@ -484,7 +490,7 @@ def _compute_shear_center_offset_y(
 
 
 def _compute_shear_center_offset_z(
-    points: List[Point],
+    points: np.ndarray,
     Cy: float, Cz: float,  
     Iy: float, Iz: float, Iyz: float
 ) -> float:
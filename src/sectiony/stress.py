@@ -2,9 +2,12 @@ from __future__ import annotations
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.path import Path
-from matplotlib.patches import PathPatch
-from dataclasses import dataclass
-from typing import Optional, TYPE_CHECKING, Literal, Callable, List, Tuple
+from matplotlib.collections import PathCollection
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional, TYPE_CHECKING, Literal, Callable, List, Tuple, get_args
+
+from .utils import bbox_window, scanline_fill
 
 if TYPE_CHECKING:
     from .section import Section
@@ -19,6 +22,12 @@ Point = Tuple[float, float]
 # Supported stress types
 StressType = Literal["sigma", "sigma_axial", "sigma_bending", "tau", "tau_shear", "tau_torsion", "von_mises"]
 
+# Stress methods available through get_stress_func
+_STRESS_METHODS: Tuple[str, ...] = get_args(StressType)
+
+# Samples per segment when searching for stress extremes
+_EXTREME_RESOLUTION = 32
+
 # Plot configuration
 _PLOT_RESOLUTION = 200  # Increased resolution
 _PLOT_PADDING_FACTOR = 0.1
@@ -36,6 +45,22 @@ _STRESS_DISPLAY_NAMES: dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=64)
+def _boundary_samples(key: Tuple[Tuple[object, ...], ...]) -> np.ndarray:
+    """
+    Read-only (N, 2) array of points sampled along every segment of a
+    geometry given as a tuple of per-contour segment tuples.
+    """
+    samples = [
+        np.asarray(segment.discretize(_EXTREME_RESOLUTION), dtype=np.float64)
+        for segments in key
+        for segment in segments
+    ]
+    points = np.concatenate(samples) if samples else np.empty((0, 2), dtype=np.float64)
+    points.flags.writeable = False
+    return points
+
+
 @dataclass
 class Stress:
     """
@@ -50,6 +75,10 @@ class Stress:
         Mx: Torsional moment about X axis.
         My: Bending moment about Y axis (bending in X-Z plane).
         Mz: Bending moment about Z axis (bending in X-Y plane).
+    
+    The stress methods are closed-form NumPy expressions, so y and z may
+    also be arrays; terms that do not depend on position come back as
+    scalars and broadcast against the others.
     """
     section: Section
     N: float = 0.0
@@ -58,12 +87,24 @@ class Stress:
     Mx: float = 0.0
     My: float = 0.0
     Mz: float = 0.0
+    
+    # Reciprocal section properties (0.0 where the property is missing),
+    # read once so each evaluation is a plain multiply
+    _inv_A: float = field(init=False, repr=False, compare=False)
+    _inv_Iy: float = field(init=False, repr=False, compare=False)
+    _inv_Iz: float = field(init=False, repr=False, compare=False)
+    _inv_J: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        section = self.section
+        self._inv_A = 1.0 / section.A if section.A else 0.0
+        self._inv_Iy = 1.0 / section.Iy if section.Iy else 0.0
+        self._inv_Iz = 1.0 / section.Iz if section.Iz else 0.0
+        self._inv_J = 1.0 / section.J if section.J else 0.0
 
     def sigma_axial(self, y: float, z: float) -> float:
         """Normal stress due to axial force: σ = N/A."""
-        if not self.section.A:
-            return 0.0
-        return self.N / self.section.A
+        return self.N * self._inv_A
 
     def sigma_bending(self, y: float, z: float) -> float:
         """
@@ -73,12 +114,7 @@ class Stress:
         
         Sign convention: positive Mz compresses positive y fibers.
         """
-        sigma = 0.0
-        if self.section.Iy:
-            sigma += (self.My * z) / self.section.Iy
-        if self.section.Iz:
-            sigma -= (self.Mz * y) / self.section.Iz
-        return sigma
+        return (self.My * self._inv_Iy) * z - (self.Mz * self._inv_Iz) * y
 
     def sigma(self, y: float, z: float) -> float:
         """Total normal stress: σ_axial + σ_bending."""
@@ -91,11 +127,7 @@ class Stress:
         NOTE: Approximate average shear stress (V/A).
         Accurate distribution requires shear flow analysis.
         """
-        if not self.section.A:
-            return 0.0
-        tau_y = self.Vy / self.section.A
-        tau_z = self.Vz / self.section.A
-        return np.sqrt(tau_y**2 + tau_z**2)
+        return np.hypot(self.Vy, self.Vz) * self._inv_A
 
     def tau_torsion(self, y: float, z: float) -> float:
         """
@@ -104,10 +136,7 @@ class Stress:
         NOTE: Approximate using τ = Mx * r / J.
         Accurate distribution requires solving Poisson's equation.
         """
-        if not self.section.J:
-            return 0.0
-        r = np.sqrt(y**2 + z**2)
-        return abs(self.Mx * r / self.section.J)
+        return abs(self.Mx * self._inv_J) * np.sqrt(y**2 + z**2)
 
     def tau(self, y: float, z: float) -> float:
         """Total shear stress magnitude (conservative sum)."""
@@ -121,44 +150,44 @@ class Stress:
 
     def get_stress_func(self, stress_type: StressType) -> StressFunc:
         """Get the stress calculation function for a given type."""
-        funcs: dict[str, StressFunc] = {
-            "sigma": self.sigma,
-            "sigma_axial": self.sigma_axial,
-            "sigma_bending": self.sigma_bending,
-            "tau": self.tau,
-            "tau_shear": self.tau_shear,
-            "tau_torsion": self.tau_torsion,
-            "von_mises": self.von_mises,
-        }
-        if stress_type not in funcs:
-            valid = ", ".join(funcs.keys())
+        # Each stress type is named after the method that computes it
+        if stress_type not in _STRESS_METHODS:
+            valid = ", ".join(_STRESS_METHODS)
             raise ValueError(f"Unknown stress type: {stress_type}. Valid types: {valid}")
-        return funcs[stress_type]
+        return getattr(self, stress_type)
 
-    def _get_all_points(self) -> List[Point]:
-        """Get all discretized points from geometry for stress calculations."""
+    def _get_all_points(self) -> np.ndarray:
+        """
+        Get the points stress extremes are searched over, as an (N, 2) array
+        of (y, z). Every segment, straight edges included, is sampled at
+        _EXTREME_RESOLUTION, since extremes such as the minimum torsional
+        stress lie part-way along an edge rather than at its corners.
+        Cached by geometry content, so edits to the geometry are picked up.
+        """
         if not self.section.geometry:
-            return []
-        points: List[Point] = []
-        for contour in self.section.geometry.contours:
-            points.extend(contour.discretize())
-        return points
+            return np.empty((0, 2), dtype=np.float64)
+        key = tuple(tuple(contour.segments) for contour in self.section.geometry.contours)
+        try:
+            return _boundary_samples(key)
+        except TypeError:
+            # Unhashable custom segments: sample without caching
+            return _boundary_samples.__wrapped__(key)
 
     def max(self, stress_type: StressType = "von_mises") -> float:
-        """Maximum stress value over geometry vertices."""
+        """Maximum stress value over points sampled along the geometry boundary."""
         points = self._get_all_points()
-        if not points:
+        if not len(points):
             return 0.0
         func = self.get_stress_func(stress_type)
-        return max(func(y, z) for y, z in points)
+        return float(np.max(func(points[:, 0], points[:, 1])))
 
     def min(self, stress_type: StressType = "von_mises") -> float:
-        """Minimum stress value over geometry vertices."""
+        """Minimum stress value over points sampled along the geometry boundary."""
         points = self._get_all_points()
-        if not points:
+        if not len(points):
             return 0.0
         func = self.get_stress_func(stress_type)
-        return min(func(y, z) for y, z in points)
+        return float(np.min(func(points[:, 0], points[:, 1])))
 
     def at(self, y: float, z: float, stress_type: StressType = "von_mises") -> float:
         """Calculate stress at a specific point."""
@@ -166,40 +195,30 @@ class Stress:
 
     def _compute_bounds(self) -> Tuple[float, float, float, float]:
         """Compute bounding box of geometry."""
-        all_ys: List[float] = []
-        all_zs: List[float] = []
-        for contour in self.section.geometry.contours:
-            for y, z in contour.discretize():
-                all_ys.append(y)
-                all_zs.append(z)
-        return min(all_ys), max(all_ys), min(all_zs), max(all_zs)
+        points = self._get_all_points()
+        min_y, min_z = points.min(axis=0).tolist()
+        max_y, max_z = points.max(axis=0).tolist()
+        return min_y, max_y, min_z, max_z
 
-    def _create_mask(self, Y: np.ndarray, Z: np.ndarray) -> np.ndarray:
+    def _create_mask(self, y_vals: np.ndarray, z_vals: np.ndarray) -> np.ndarray:
         """
-        Create mask for points inside solid regions but outside hollow regions.
-        Uses Path.contains_points which is accurate for arbitrary polygons.
+        Create mask for points inside solid regions but outside hollow regions,
+        on the grid y_vals x z_vals (rows follow y, columns follow z).
+        Uses a crossing-number scanline fill, which is exact for arbitrary
+        polygons and matches Path.contains_points. Each contour is filled
+        only over the grid window inside its bounding box.
         """
-        points_flat = np.column_stack((Y.flatten(), Z.flatten()))
-        
-        solids = [c for c in self.section.geometry.contours if not c.hollow]
-        hollows = [c for c in self.section.geometry.contours if c.hollow]
-        
-        is_in_solid = np.zeros(len(points_flat), dtype=bool)
-        for solid in solids:
-            # Create Path from discretized points
-            pts = solid.discretize()
-            if len(pts) >= 3:
-                path = Path(pts)
-                is_in_solid |= path.contains_points(points_flat)
-        
-        is_in_hollow = np.zeros(len(points_flat), dtype=bool)
-        for hollow in hollows:
-            pts = hollow.discretize()
+        shape = (len(y_vals), len(z_vals))
+        is_in_solid = np.zeros(shape, dtype=bool)
+        is_in_hollow = np.zeros(shape, dtype=bool)
+        for contour in self.section.geometry.contours:
+            pts = contour.discretize_xy()
             if len(pts) >= 3:
-                path = Path(pts)
-                is_in_hollow |= path.contains_points(points_flat)
+                target = is_in_hollow if contour.hollow else is_in_solid
+                rows, cols = bbox_window(pts, y_vals, z_vals)
+                target[rows, cols] |= scanline_fill(pts, y_vals[rows], z_vals[cols])
         
-        return (is_in_solid & ~is_in_hollow).reshape(Y.shape)
+        return is_in_solid & ~is_in_hollow
 
     def _draw_outlines(self, ax: plt.Axes) -> None:
         """
@@ -207,36 +226,48 @@ class Stress:
         Uses shared path conversion from plotter module.
         Hollows are clipped to only show the parts that intersect with solids.
         """
-        from .plotter import contour_to_path, points_to_path, _clip_hollow_to_solids
+        from .plotter import contour_to_path, points_to_path, _solid_clippers, _clip_hollow_to_solids
         
         solids = [c for c in self.section.geometry.contours if not c.hollow]
         hollows = [c for c in self.section.geometry.contours if c.hollow]
+        solid_points = _solid_clippers(solids) if hollows else []
+        
+        solid_paths: List[Path] = []
+        hollow_paths: List[Path] = []
         
         # Draw solids
         for contour in solids:
             path = contour_to_path(contour)
             if path is None:
                 continue
-            patch = PathPatch(path, facecolor='none', edgecolor='black', 
-                              linewidth=1.5)
-            ax.add_patch(patch)
+            solid_paths.append(path)
             
         # Draw hollows - clipped to solid regions
         for contour in hollows:
-            hollow_points = contour.discretize()
+            hollow_points = contour.discretize_xy()
             if len(hollow_points) < 3:
                 continue
             
             # Clip hollow to solid regions
-            clipped_regions = _clip_hollow_to_solids(hollow_points, solids)
+            clipped_regions = _clip_hollow_to_solids(hollow_points, solid_points)
             
             for clipped_points in clipped_regions:
                 path = points_to_path(clipped_points)
                 if path is None:
                     continue
-                patch = PathPatch(path, facecolor='none', edgecolor='black',
-                                 linestyle='--', linewidth=1.0)
-                ax.add_patch(patch)
+                hollow_paths.append(path)
+        
+        # Limits are set by the caller, so skip the per-artist data limit update
+        if solid_paths:
+            ax.add_collection(PathCollection(
+                solid_paths, facecolors='none', edgecolors='black',
+                linewidths=1.5
+            ), autolim=False)
+        if hollow_paths:
+            ax.add_collection(PathCollection(
+                hollow_paths, facecolors='none', edgecolors='black',
+                linestyles='--', linewidths=1.0
+            ), autolim=False)
 
     def plot(
         self,
@@ -278,17 +309,19 @@ class Stress:
         # Create evaluation grid with higher resolution
         z_grid = np.linspace(min_z - padding, max_z + padding, _PLOT_RESOLUTION)
         y_grid = np.linspace(min_y - padding, max_y + padding, _PLOT_RESOLUTION)
-        Z, Y = np.meshgrid(z_grid, y_grid)
-
-        # Compute stress values
-        S = np.vectorize(func)(Y, Z)
 
-        # Mask points outside geometry
-        mask = self._create_mask(Y, Z)
-        S_masked = np.where(mask, S, np.nan)
+        # Evaluate stresses only at grid points inside the geometry, in one
+        # call on the gathered coordinates; points outside stay NaN
+        mask = self._create_mask(y_grid, z_grid)
+        shape = mask.shape
+        S_masked = np.full(shape, np.nan)
+        S_masked[mask] = func(
+            np.broadcast_to(y_grid[:, None], shape)[mask],
+            np.broadcast_to(z_grid[None, :], shape)[mask],
+        )
 
         # Plot contours
-        contour_plot = ax.contourf(Z, Y, S_masked, cmap=cmap, levels=_CONTOUR_LEVELS)
+        contour_plot = ax.contourf(z_grid, y_grid, S_masked, cmap=cmap, levels=_CONTOUR_LEVELS)
         display_name = _STRESS_DISPLAY_NAMES[stress_type] if stress_type in _STRESS_DISPLAY_NAMES else stress_type
         colorbar = plt.colorbar(contour_plot, ax=ax, label=display_name, format='%.4g')
 
@@ -1,5 +1,6 @@
 # utils.py
 from __future__ import annotations
+from typing import Tuple
 import numpy as np
 
 def heaviside(x: float) -> float:
@@ -11,6 +12,55 @@ def clip_to_span(x: float, L: float) -> float:
     return max(0.0, min(L, x))
 
 
+def bbox_window(arr: np.ndarray, y_vals: np.ndarray, z_vals: np.ndarray) -> Tuple[slice, slice]:
+    """Row and column slices of the grid cells inside a polygon's bounding box."""
+    lo = arr.min(axis=0)
+    hi = arr.max(axis=0)
+    # Cells lying exactly on the box edges are kept in the window
+    r0 = np.searchsorted(y_vals, lo[0], side='left')
+    r1 = np.searchsorted(y_vals, hi[0], side='right')
+    c0 = np.searchsorted(z_vals, lo[1], side='left')
+    c1 = np.searchsorted(z_vals, hi[1], side='right')
+    return slice(r0, r1), slice(c0, c1)
+
+
+def scanline_fill(arr: np.ndarray, y_win: np.ndarray, z_win: np.ndarray) -> np.ndarray:
+    """
+    Point-in-polygon test for the grid window spanned by y_win x z_win.
+    
+    Crossing-number rule evaluated one grid column (constant z) at a time:
+    each edge crossing a column toggles every cell beyond the crossing, so
+    a whole column is labelled from its few crossings. The half-open edge
+    rules match matplotlib's ``Path.contains_points``.
+    """
+    y0 = arr[:, 0]
+    z0 = arr[:, 1]
+    y1 = np.roll(y0, -1)
+    z1 = np.roll(z0, -1)
+    
+    # Edges (i -> i+1, wrapping) crossing each column
+    above0 = z0 >= z_win[:, None]
+    above1 = z1 >= z_win[:, None]
+    col, edge = np.nonzero(above0 != above1)
+    
+    t = (z_win[col] - z0[edge]) / (z1[edge] - z0[edge])
+    y_cross = y0[edge] + t * (y1[edge] - y0[edge])
+    
+    # First cell past the crossing; a cell exactly on it counts as past
+    # for upward edges only
+    upward = above1[col, edge]
+    first = np.where(
+        upward,
+        np.searchsorted(y_win, y_cross, side='right'),
+        np.searchsorted(y_win, y_cross, side='left'),
+    )
+    
+    toggles = np.zeros((len(z_win), len(y_win) + 1), dtype=np.int32)
+    np.add.at(toggles, (col, first), 1)
+    inside = np.cumsum(toggles[:, :-1], axis=1) & 1
+    return inside.T.astype(bool)
+
+
 def solve_poisson_jacobi(mask: np.ndarray, h: float, max_iter: int = 5000, tol: float = 1e-6) -> np.ndarray:
     """
     Solve Poisson equation del^2(phi) = -2 for torsion using optimized Jacobi.
@@ -67,6 +117,101 @@ def solve_poisson_jacobi(mask: np.ndarray, h: float, max_iter: int = 5000, tol:
     return phi
 
 
+def solve_poisson_sor(
+    mask: np.ndarray, 
+    h: float, 
+    max_iter: int = 5000, 
+    tol: float = 1e-6, 
+    omega: float | None = None,
+    dtype: type = np.float64
+) -> np.ndarray:
+    """
+    Solve Poisson equation del^2(phi) = -2 for torsion using red-black SOR.
+    
+    Cells are coloured like a chessboard; each half-sweep updates one colour
+    in place from its neighbours of the other colour, so the update is a
+    Gauss-Seidel step that vectorizes like Jacobi. Over-relaxation then cuts
+    the iteration count by an order of magnitude.
+    
+    Args:
+        mask: Boolean array, True where phi is solved, False where phi=0 (boundary)
+        h: Grid spacing
+        max_iter: Maximum iterations (full red + black sweeps)
+        tol: Convergence tolerance on the largest update, relative to max(phi)
+        omega: Relaxation factor; defaults to an estimate of the optimum
+            for the section's thickness (see ``_sor_omega``)
+        dtype: Working precision. np.float32 halves the memory traffic of
+            each sweep and is ample for tol around 1e-6; tighter tolerances
+            need np.float64
+        
+    Returns:
+        phi: Solution array, in the working precision
+    """
+    ny, nz = mask.shape
+    phi = np.zeros((ny, nz), dtype=dtype)
+    if ny < 3 or nz < 3:
+        return phi
+    
+    source = 2.0 * h * h
+    if omega is None:
+        omega = _sor_omega(mask)
+    
+    # Per-colour relaxation weights on the interior: omega on that colour's
+    # cells inside the mask, 0 elsewhere so phi stays 0 outside the section
+    rows, cols = np.indices((ny - 2, nz - 2))
+    red = (rows + cols) % 2 == 0
+    inner = mask[1:-1, 1:-1]
+    weights = (
+        np.where(inner & red, omega, 0.0).astype(dtype),
+        np.where(inner & ~red, omega, 0.0).astype(dtype),
+    )
+    
+    centre = phi[1:-1, 1:-1]
+    delta = np.empty((ny - 2, nz - 2), dtype=dtype)
+    
+    for iteration in range(max_iter):
+        check = iteration % 10 == 9
+        max_delta = 0.0
+        for weight in weights:
+            # delta = w * (Gauss-Seidel value - current value), in place
+            np.add(phi[:-2, 1:-1], phi[2:, 1:-1], out=delta)
+            delta += phi[1:-1, :-2]
+            delta += phi[1:-1, 2:]
+            delta += source
+            delta *= 0.25
+            delta -= centre
+            delta *= weight
+            centre += delta
+            if check:
+                max_delta = max(max_delta, float(np.abs(delta).max()))
+        
+        # Check convergence every 10 iterations (cheaper)
+        if check and max_delta <= tol * max(float(centre.max()), 1e-300):
+            break
+    
+    return phi
+
+
+def _sor_omega(mask: np.ndarray) -> float:
+    """
+    Relaxation factor 2 / (1 + sin(pi / n)), optimal for an n x n square,
+    with n estimated from the mask as 4 * cells / boundary cells. This
+    tracks the section's thickness, which sets the convergence rate: a
+    thin-walled section needs far less over-relaxation than its grid size
+    would suggest.
+    """
+    padded = np.pad(mask, 1)
+    interior = (
+        padded[:-2, 1:-1] & padded[2:, 1:-1] & padded[1:-1, :-2] & padded[1:-1, 2:]
+    )
+    n_cells = int(mask.sum())
+    n_boundary = n_cells - int((mask & interior).sum())
+    if n_boundary == 0:
+        return 1.0
+    n = max(4.0 * n_cells / n_boundary, 2.0)
+    return 2.0 / (1.0 + np.sin(np.pi / n))
+
+
 def solve_warping_jacobi(
     mask: np.ndarray, 
     h: float, 
@@ -94,105 +239,65 @@ def solve_warping_jacobi(
         omega: Solution array
     """
     ny, nz = mask.shape
-    omega = np.zeros((ny, nz), dtype=np.float64)
-    omega_new = np.zeros((ny, nz), dtype=np.float64)
     
     # Pre-calculate coordinates relative to centroid
     # Y varies along rows (axis 0), Z varies along cols (axis 1)
     # y_vals corresponds to axis 0 indices
     # z_vals corresponds to axis 1 indices
-    Y, Z = np.meshgrid(y_vals, z_vals, indexing='ij')
-    Yc = Y - cy
-    Zc = Z - cz
-    
-    # Pre-compute boundary fluxes for each direction
-    # Flux q = y*nz - z*ny
-    # Top neighbor (y-h): n=(-1, 0) -> q = y(0) - z(-1) = z
-    # Bottom neighbor (y+h): n=(1, 0) -> q = y(0) - z(1) = -z
-    # Left neighbor (z-h): n=(0, -1) -> q = y(-1) - z(0) = -y
-    # Right neighbor (z+h): n=(0, 1) -> q = y(1) - z(0) = y
-    
-    # Flux * h terms to add to center value
-    # If neighbor is missing, we use ghost point: omega_neighbor = omega_self + h*q
-    # So we add h*q to the sum in the update rule
+    Yc = (np.asarray(y_vals, dtype=np.float64) - cy)[:, None]
+    Zc = (np.asarray(z_vals, dtype=np.float64) - cz)[None, :]
     
-    flux_top = Zc * h
-    flux_bottom = -Zc * h
-    flux_left = -Yc * h
-    flux_right = Yc * h
+    # Boundary fluxes for each direction, q = y*nz - z*ny:
+    # Top neighbor (y-h): n=(-1, 0) -> q = z
+    # Bottom neighbor (y+h): n=(1, 0) -> q = -z
+    # Left neighbor (z-h): n=(0, -1) -> q = -y
+    # Right neighbor (z+h): n=(0, 1) -> q = y
+    #
+    # A neighbor outside the mask is replaced by the ghost value
+    # omega_self + h*q. Since omega is held at 0 outside the mask, the
+    # update for a cell is
+    #   4*new = (sum of the 4 zero-padded neighbors)
+    #           + n_missing * omega_self + h * (sum of q over missing sides)
+    # where n_missing and the flux sum depend only on the mask, so they are
+    # computed once and the loop body becomes a fixed stencil.
+    inside = mask.astype(np.float64)
+    missing_top = np.ones_like(inside)
+    missing_top[1:, :] -= inside[:-1, :]
+    missing_bottom = np.ones_like(inside)
+    missing_bottom[:-1, :] -= inside[1:, :]
+    missing_left = np.ones_like(inside)
+    missing_left[:, 1:] -= inside[:, :-1]
+    missing_right = np.ones_like(inside)
+    missing_right[:, :-1] -= inside[:, 1:]
     
-    # Identify interior and boundary cells
-    # We only update cells within the mask
-    # For each cell in mask, we check neighbors
+    n_missing = missing_top + missing_bottom + missing_left + missing_right
+    flux = h * ((missing_top - missing_bottom) * Zc + (missing_right - missing_left) * Yc)
     
-    # Shifted masks for neighbors (True if neighbor is IN mask)
-    mask_top = np.zeros_like(mask)
-    mask_top[1:, :] = mask[:-1, :]
+    # Fold the 1/4 and the mask into the constant terms
+    quarter_inside = 0.25 * inside
+    self_coeff = quarter_inside * n_missing
+    flux *= quarter_inside
     
-    mask_bottom = np.zeros_like(mask)
-    mask_bottom[:-1, :] = mask[1:, :]
-    
-    mask_left = np.zeros_like(mask)
-    mask_left[:, 1:] = mask[:, :-1]
-    
-    mask_right = np.zeros_like(mask)
-    mask_right[:, :-1] = mask[:, 1:]
-    
-    # For vectorized operations, we only care about pixels in the mask
-    # To optimize, we can use simple iteration with boolean indexing or just iterate whole array
-    # Iterating whole array is cleaner code, masked at end
+    # Pre-allocate buffers once; the loop below allocates nothing
+    omega = np.zeros((ny, nz), dtype=np.float64)
+    omega_new = np.zeros((ny, nz), dtype=np.float64)
+    scratch = np.empty((ny, nz), dtype=np.float64)
     
     prev_sum = 0.0
     
     for iteration in range(max_iter):
-        # We construct the sum of neighbors
-        # Start with 0
-        neighbor_sum = np.zeros_like(omega)
-        
-        # Add Top Neighbor
-        # If top is in mask, take value. Else take self + flux
-        # Actually easier: Take top value (masked 0) + (if top not in mask: self + flux)
-        # But self is from previous step? Yes. Jacobi uses previous step.
-        
-        # Optimization:
-        # 4*new = (val_top + val_bottom + val_left + val_right)
-        # val_top = omega[y-1] if inside else (omega[y] + flux_top)
-        
-        # Since this logic is complex to vectorize efficiently without heavy memory use,
-        # let's do it in steps.
-        
-        # Get shifted arrays (padded with 0)
-        # These represent omega[y-1], omega[y+1], etc.
-        o_top = np.zeros_like(omega); o_top[1:, :] = omega[:-1, :]
-        o_bot = np.zeros_like(omega); o_bot[:-1, :] = omega[1:, :]
-        o_lft = np.zeros_like(omega); o_lft[:, 1:] = omega[:, :-1]
-        o_rgt = np.zeros_like(omega); o_rgt[:, :-1] = omega[:, 1:]
-        
-        # Add contributions
-        # If neighbor exists (mask_top True), use o_top. 
-        # Else use omega (self) + flux_top
-        
-        # Term 1: Top
-        term = np.where(mask_top, o_top, omega + flux_top)
-        neighbor_sum += term
-        
-        # Term 2: Bottom
-        term = np.where(mask_bottom, o_bot, omega + flux_bottom)
-        neighbor_sum += term
-        
-        # Term 3: Left
-        term = np.where(mask_left, o_lft, omega + flux_left)
-        neighbor_sum += term
-        
-        # Term 4: Right
-        term = np.where(mask_right, o_rgt, omega + flux_right)
-        neighbor_sum += term
-        
-        # Update
-        omega_new = 0.25 * neighbor_sum
+        # Zero-padded neighbor sum (values outside the mask are 0)
+        omega_new.fill(0.0)
+        omega_new[1:, :] += omega[:-1, :]
+        omega_new[:-1, :] += omega[1:, :]
+        omega_new[:, 1:] += omega[:, :-1]
+        omega_new[:, :-1] += omega[:, 1:]
+        omega_new *= quarter_inside
         
-        # Enforce mask (outside is 0, though it doesn't matter for next step's inside calc)
-        omega_new[~mask] = 0.0
+        # Ghost-point terms for missing neighbors; also zeroes outside mask
+        np.multiply(omega, self_coeff, out=scratch)
+        omega_new += scratch
+        omega_new += flux
         
         # Swap
         omega, omega_new = omega_new, omega
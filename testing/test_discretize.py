@@ -1,6 +1,6 @@
 import math
 import unittest
-from sectiony.geometry import Line, Arc, Contour
+from sectiony.geometry import Line, Arc, CubicBezier, Contour
 
 class TestDiscretize(unittest.TestCase):
     def test_line_discretize_resolution(self):
@@ -82,6 +82,72 @@ class TestDiscretize(unittest.TestCase):
             # So the chords between them should be equal length for a constant curvature arc.
             self.assertAlmostEqual(d, first_dist, places=4)
 
+    def test_full_circle_arc_discretize(self):
+        # Arc samples come from a shared trig table; results must match
+        # the general sampling and not be affected by the cache being shared.
+        arc = Arc((1.0, 2.0), 5.0, 0.0, 2 * math.pi)
+        points = arc.discretize(resolution=16)
+        self.assertEqual(len(points), 17)
+        for i, (y, z) in enumerate(points):
+            theta = 2 * math.pi * i / 16
+            self.assertAlmostEqual(y, 1.0 + 5.0 * math.sin(theta))
+            self.assertAlmostEqual(z, 2.0 + 5.0 * math.cos(theta))
+
+        small = Arc((0.0, 0.0), 2.0, 0.0, 2 * math.pi).discretize(resolution=16)
+        self.assertAlmostEqual(math.hypot(*small[3]), 2.0)
+        self.assertAlmostEqual(math.hypot(points[3][0] - 1.0, points[3][1] - 2.0), 5.0)
+
+    def test_contour_to_arrays(self):
+        # The SoA view holds the same points as the tuple list
+        contour = Contour([
+            Line((0, 0), (0, 10)),
+            Arc((0, 5), 5.0, math.pi / 2, 3 * math.pi / 2),
+        ])
+        ys, zs = contour.to_arrays(resolution=16)
+        points = contour.discretize(resolution=16)
+        self.assertEqual(len(ys), len(points))
+        self.assertTrue(ys.flags.c_contiguous and zs.flags.c_contiguous)
+        self.assertEqual(contour.discretize_xy(16).shape, (len(points), 2))
+        for y, z, p in zip(ys, zs, points):
+            self.assertEqual((y, z), p)
+
+    def test_contour_discretize_bridges_gaps(self):
+        # A segment that does not start where the previous one ended keeps
+        # its start point, so the gap becomes a straight edge
+        contour = Contour([Line((0, 0), (10, 0)), Line((10, 10), (0, 10))])
+        self.assertEqual(
+            contour.discretize(4),
+            [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0), (0.0, 10.0)],
+        )
+
+    def test_bezier_length(self):
+        # Straight Bezier is exact; a quarter-circle Bezier matches the arc closely
+        straight = CubicBezier((0, 0), (1, 0), (2, 0), (3, 0))
+        self.assertAlmostEqual(straight.length, 3.0)
+        quarter = Arc((0, 0), 10.0, 0.0, math.pi / 2).to_beziers()[0]
+        self.assertAlmostEqual(quarter.length, 5 * math.pi, places=2)
+
+    def test_bezier_tolerance_discretize(self):
+        # Adaptive flattening: a straight Bezier needs one segment, and a
+        # curved one stays within the requested tolerance
+        straight = CubicBezier((0, 0), (1, 0), (2, 0), (3, 0))
+        self.assertEqual(len(straight.discretize(tolerance=0.01)), 2)
+        quarter = Arc((0, 0), 10.0, 0.0, math.pi / 2).to_beziers()[0]
+        points = quarter.discretize(tolerance=0.01)
+        for (y1, z1), (y2, z2) in zip(points, points[1:]):
+            # Sagitta of each chord against the (near-circular) curve
+            chord_mid = ((y1 + y2) / 2, (z1 + z2) / 2)
+            self.assertLess(10.0 - math.hypot(*chord_mid), 0.01 + 1e-3)
+
+    def test_bezier_tolerance_must_be_positive(self):
+        bz = CubicBezier((0, 0), (1, 1), (2, 1), (3, 0))
+        contour = Contour([bz])
+        for tolerance in (0.0, -0.5):
+            with self.assertRaises(ValueError):
+                bz.discretize(tolerance=tolerance)
+            with self.assertRaises(ValueError):
+                contour.discretize(tolerance=tolerance)
+
 if __name__ == '__main__':
     unittest.main()
 
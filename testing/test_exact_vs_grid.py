@@ -41,6 +41,11 @@ class TestExactVsGrid(unittest.TestCase):
         # Check within 5%
         self.assertAlmostEqual(sec.Zpl_y, expected_Zpl_y, delta=expected_Zpl_y * 0.05)
         self.assertAlmostEqual(sec.Zpl_z, expected_Zpl_z, delta=expected_Zpl_z * 0.05)
+        
+        # J for a 2:1 rectangle: beta * h * b^3 with beta = 0.229 (series solution)
+        expected_J = 0.229 * h * b**3
+        print(f"  J: Calc={sec.J:.4f}, Exact={expected_J:.4f}")
+        self.assertAlmostEqual(sec.J, expected_J, delta=expected_J * 0.01)
 
     def test_circular_section(self):
         """Compare Exact vs Grid for solid circle."""
@@ -62,5 +67,56 @@ class TestExactVsGrid(unittest.TestCase):
         
         self.assertAlmostEqual(sec.Zpl_y, expected_Zpl, delta=expected_Zpl * 0.10)
 
+    def test_scanline_fill_matches_path(self):
+        """Grid rasterization agrees with matplotlib, including on-edge cells."""
+        import numpy as np
+        from matplotlib.path import Path as MplPath
+        from sectiony.utils import scanline_fill
+        
+        # Edges fall exactly on grid lines
+        arr = np.array([(0.0, 0.0), (4.0, 0.0), (4.0, 2.0), (2.0, 2.0), (2.0, 4.0), (0.0, 4.0)])
+        y_win = np.arange(-1.0, 5.5, 0.5)
+        z_win = np.arange(-1.0, 5.5, 0.5)
+        Y, Z = np.meshgrid(y_win, z_win, indexing='ij')
+        grid_pts = np.column_stack((Y.ravel(), Z.ravel()))
+        
+        # On-edge cells depend on winding, so check both orientations
+        for pts in (arr, arr[::-1]):
+            expected = MplPath(pts).contains_points(grid_pts).reshape(Y.shape)
+            np.testing.assert_array_equal(scanline_fill(pts, y_win, z_win), expected)
+
+    def test_contour_with_gap(self):
+        """A gap between segments is bridged the same way by every property."""
+        from sectiony.geometry import Arc, Line
+        
+        # Half disc whose closing line starts away from the arc's end point;
+        # the gap must become a straight edge, for the exact moments and the
+        # grid / boundary properties alike
+        arc = Arc((0.0, 0.0), 10.0, 0.0, math.pi)
+        gapped = Section(name="Gap", geometry=Geometry(contours=[
+            Contour([arc, Line((2.0, -8.0), (0.0, 10.0))])
+        ]))
+        bridged = Section(name="Bridged", geometry=Geometry(contours=[
+            Contour([arc, Line((0.0, -10.0), (2.0, -8.0)), Line((2.0, -8.0), (0.0, 10.0))])
+        ]))
+        
+        # The bridge cuts a triangle of area 20 off the half disc
+        self.assertAlmostEqual(gapped.A, 50 * math.pi - 20.0, places=6)
+        for name in ("A", "Cy", "Cz", "Iy", "Iz", "J", "Zpl_y", "Zpl_z", "y_max", "z_max", "SCy", "SCz", "Cw"):
+            self.assertAlmostEqual(getattr(gapped, name), getattr(bridged, name), places=6, msg=name)
+
+    def test_sor_matches_jacobi(self):
+        """Red-black SOR converges to the same discrete torsion solution as Jacobi."""
+        import numpy as np
+        from sectiony.utils import solve_poisson_jacobi, solve_poisson_sor
+        
+        mask = np.zeros((30, 40), dtype=bool)
+        mask[3:27, 3:37] = True
+        mask[3:15, 3:20] = False  # L-shaped region
+        
+        phi_jacobi = solve_poisson_jacobi(mask, 0.5, max_iter=20000, tol=1e-12)
+        phi_sor = solve_poisson_sor(mask, 0.5, tol=1e-12)
+        np.testing.assert_allclose(phi_sor, phi_jacobi, atol=1e-8)
+
 if __name__ == '__main__':
     unittest.main()
@@ -2,6 +2,10 @@ import unittest
 import math
 import os
 import json
+from decimal import Decimal
+from unittest.mock import patch
+import numpy as np
+from sectiony import geometry as geometry_module
 from sectiony.geometry import Line, Arc, CubicBezier, Contour, Geometry
 
 class TestGeometryJSON(unittest.TestCase):
@@ -72,6 +76,51 @@ class TestGeometryJSON(unittest.TestCase):
         self.assertIsInstance(segments[0], Line)
         self.assertIsInstance(segments[1], Arc)
 
+    def _numpy_geometry(self):
+        points = np.array([[0.0, 0.0], [10.0, 0.0], [10.0, 5.0], [0.0, 5.0]])
+        arc = Arc(center=np.array([5.0, 5.0]), radius=np.float64(2.0),
+                  start_angle=np.float64(0.0), end_angle=np.float64(math.pi))
+        return Geometry(contours=[Contour.from_points(points), Contour([arc], hollow=True)])
+
+    def test_json_numpy_coordinates_stdlib(self):
+        """Geometry with NumPy scalar coordinates saves through stdlib json."""
+        geom = self._numpy_geometry()
+        with patch.object(geometry_module, "orjson", None):
+            geom.to_json(self.filename)
+            loaded = Geometry.from_json(self.filename)
+        self.assertEqual(loaded.to_dict(), geom.to_dict())
+
+    @unittest.skipIf(geometry_module.orjson is None, "orjson not installed")
+    def test_json_numpy_coordinates_orjson(self):
+        """The orjson path accepts NumPy scalars and writes the same data."""
+        geom = self._numpy_geometry()
+        geom.to_json(self.filename)
+        with open(self.filename, 'r') as f:
+            self.assertEqual(json.load(f), json.loads(json.dumps(geom.to_dict())))
+
+    @unittest.skipIf(geometry_module.orjson is None, "orjson not installed")
+    def test_json_backends_match(self):
+        """orjson and stdlib json write the same data for the same geometry."""
+        from sectiony.library import rhs
+        for geom in (self._numpy_geometry(), rhs(100, 200, 8, 12).geometry):
+            geom.to_json(self.filename)
+            with open(self.filename, 'r') as f:
+                fast = json.load(f)
+            with patch.object(geometry_module, "orjson", None):
+                geom.to_json(self.filename)
+            with open(self.filename, 'r') as f:
+                self.assertEqual(json.load(f), fast)
+
+    def test_json_rejects_unknown_types(self):
+        """Values stdlib json cannot encode are rejected by both backends."""
+        geom = self._numpy_geometry()
+        backends = [None] if geometry_module.orjson is None else [None, geometry_module.orjson]
+        with patch.object(Geometry, "to_dict", return_value={"value": Decimal("1.5")}):
+            for backend in backends:
+                with patch.object(geometry_module, "orjson", backend):
+                    with self.assertRaises(TypeError):
+                        geom.to_json(self.filename)
+
     def test_contour_from_points(self):
         """Test creating contour from points (polygon)."""
         points = [(0, 0), (10, 0), (10, 10), (0, 10)]
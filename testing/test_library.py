@@ -41,15 +41,24 @@ class TestLibrary(unittest.TestCase):
         self.assertAlmostEqual(sec.Iy, expected_I, delta=expected_I * 0.02)
         self.assertAlmostEqual(sec.Iz, expected_I, delta=expected_I * 0.02) 
         
-        # Note: Grid-based J calculation has known limitations for hollow sections
-        # (requires different boundary conditions on inner vs outer boundaries)
-        # Skipping J validation for hollow sections
+        # Concentric tubes use the closed-form polar moment rather than the
+        # grid solve, which cannot represent the inner boundary condition
+        self.assertAlmostEqual(sec.J, expected_J, delta=expected_J * 1e-9)
 
         # Radius of Gyration
         expected_r = math.sqrt(expected_I / expected_A)
         self.assertAlmostEqual(sec.ry, expected_r, delta=expected_r * 0.02)
         self.assertAlmostEqual(sec.rz, expected_r, delta=expected_r * 0.02)
 
+    def test_chs_curved_moments_exact(self):
+        # Arcs are integrated along the curve, not along their chords
+        sec = chs(d=200.0, t=10.0)
+        expected_A = math.pi * (100.0**2 - 90.0**2)
+        expected_I = math.pi / 4 * (100.0**4 - 90.0**4)
+        self.assertAlmostEqual(sec.A, expected_A, delta=expected_A * 1e-9)
+        self.assertAlmostEqual(sec.Iy, expected_I, delta=expected_I * 1e-9)
+        self.assertAlmostEqual(sec.Iz, expected_I, delta=expected_I * 1e-9)
+
     def test_rhs_sharp(self):
         # RHS with radius 0 is just a hollow rectangle
         b = 10.0 # Width (z)
@@ -154,5 +163,29 @@ class TestLibrary(unittest.TestCase):
         
         self.assertAlmostEqual(sec.A, expected_A, places=5)
 
+    def test_u_torsion_and_shear_centre(self):
+        # Reference values for the channel's grid J and sectorial shear
+        # centre / warping constant. The rounded channel's inner fillets end
+        # short of the next straight edge; that gap is bridged, not cut off
+        sec = u(100.0, 200.0, 8.0, 12.0, 10.0)
+        self.assertAlmostEqual(sec.J, 220306.2, delta=220306.2 * 0.01)
+        self.assertAlmostEqual(sec.SCz, 68.068, places=2)
+        self.assertAlmostEqual(sec.Cw, 7.4745e10, delta=7.4745e10 * 0.01)
+        
+        sharp = u(100.0, 200.0, 8.0, 12.0, 0.0)
+        self.assertAlmostEqual(sharp.SCz, 66.072, places=2)
+        self.assertAlmostEqual(sharp.Cw, 7.2120e10, delta=7.2120e10 * 0.01)
+
+    def test_repeated_sections_are_independent(self):
+        # Identical dimensions reuse cached properties, but each Section
+        # keeps its own values and geometry
+        a = rhs(10.0, 20.0, 1.0, 1.0)
+        b = rhs(10.0, 20.0, 1.0, 1.0)
+        self.assertEqual(a.A, b.A)
+        self.assertEqual(a.J, b.J)
+        self.assertIsNot(a.geometry, b.geometry)
+        a.A = 0.0
+        self.assertEqual(rhs(10.0, 20.0, 1.0, 1.0).A, b.A)
+
 if __name__ == '__main__':
     unittest.main()
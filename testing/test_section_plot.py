@@ -69,5 +69,29 @@ class TestSectionPlot(unittest.TestCase):
         self.assertEqual(ax.get_ylabel(), 'y')
         plt.close(fig)
 
+    def test_arc_path_from_list_center(self):
+        """Arcs built from list coordinates convert to paths like tuple ones."""
+        from sectiony.geometry import Arc
+        from sectiony.plotter import contour_to_path
+        
+        from_list = contour_to_path(Contour([Arc(center=[0.0, 0.0], radius=5.0, start_angle=0.0, end_angle=2 * math.pi)]))
+        from_tuple = contour_to_path(Contour([Arc(center=(0.0, 0.0), radius=5.0, start_angle=0.0, end_angle=2 * math.pi)]))
+        self.assertEqual(from_list.vertices.tolist(), from_tuple.vertices.tolist())
+        self.assertAlmostEqual(abs(from_list.vertices).max(), 5.0, places=9)
+
+    def test_segment_subclasses_in_path(self):
+        """Subclasses of the segment types are drawn like their base type."""
+        from sectiony.geometry import Line
+        from sectiony.plotter import contour_to_path
+        
+        class MyLine(Line):
+            pass
+        
+        pts = [(0.0, 0.0), (0.0, 10.0), (5.0, 0.0)]
+        path = contour_to_path(Contour([MyLine(a, b) for a, b in zip(pts, pts[1:] + pts[:1])]))
+        base = contour_to_path(Contour.from_points(pts))
+        self.assertEqual(path.vertices.tolist(), base.vertices.tolist())
+        self.assertEqual(path.codes.tolist(), base.codes.tolist())
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 import sys
 import unittest
+import dataclasses
 import math
 import numpy as np
 from pathlib import Path
@@ -153,5 +154,31 @@ class TestSectionProperties(unittest.TestCase):
         # Total A = 36
         self.assertAlmostEqual(sec.A, 36.0, places=5)
 
+    def test_list_and_array_points(self):
+        # Coordinates given as lists or arrays build the same (cached) section
+        points = [[0, 0], [10, 0], [10, 5], [0, 5]]
+        for pts in (points, np.array(points, dtype=float)):
+            sec = Section(name="Rect", geometry=Geometry(contours=[Contour.from_points(pts)]))
+            self.assertAlmostEqual(sec.A, 50.0, places=9)
+
+    def test_edited_contour_recalculates(self):
+        # Segments are frozen, but editing the contour's segment list must
+        # not return stale cached properties
+        geometry = Geometry(contours=[Contour.from_points([(0, 0), (10, 0), (10, 5), (0, 5)])])
+        self.assertAlmostEqual(geometry.calculate_properties().A, 50.0, places=9)
+
+        contour = geometry.contours[0]
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            contour.segments[1].end = (10, 8)
+        contour.segments = Contour.from_points([(0, 0), (10, 0), (10, 8), (0, 8)]).segments
+        self.assertAlmostEqual(geometry.calculate_properties().A, 80.0, places=9)
+
+    def test_reduce_hollows_returns_point_lists(self):
+        geometry = Geometry(contours=[Contour.from_points([(0, 0), (10, 0), (10, 5), (0, 5)])])
+        (points, hollow), = geometry.reduce_hollows()
+        self.assertIsInstance(points, list)
+        self.assertIsInstance(points[0], tuple)
+        self.assertFalse(hollow)
+
 if __name__ == '__main__':
     unittest.main()
@@ -103,6 +103,17 @@ class TestStressCalculations(unittest.TestCase):
         self.assertAlmostEqual(stress.at(0, 0, "sigma_axial"), 10.0)
         self.assertAlmostEqual(stress.at(0, 0, "sigma"), 10.0)
 
+    def test_array_evaluation_matches_scalar(self):
+        import numpy as np
+        stress = Stress(self.square_section, N=1000.0, Vy=60.0, Vz=80.0, Mx=300.0, My=200.0, Mz=500.0)
+        ys = np.array([-5.0, 0.0, 2.5, 5.0])
+        zs = np.array([5.0, 0.0, -1.0, -5.0])
+        for stress_type in ["sigma", "sigma_axial", "sigma_bending", "tau", "tau_shear", "tau_torsion", "von_mises"]:
+            func = stress.get_stress_func(stress_type)
+            values = np.broadcast_to(func(ys, zs), ys.shape)
+            for y, z, value in zip(ys, zs, values):
+                self.assertAlmostEqual(value, func(float(y), float(z)))
+
 
 class TestStressMinMax(unittest.TestCase):
     def setUp(self):
@@ -129,6 +140,39 @@ class TestStressMinMax(unittest.TestCase):
         self.assertLess(min_sigma, 0)
         self.assertAlmostEqual(max_sigma, -min_sigma)
 
+    def test_min_along_edges(self):
+        # Torsional stress grows with distance from the centroid, so on a
+        # 20x10 rectangle its minimum is at the middle of a long edge (r = 5),
+        # not at a corner; the edges must be sampled, not just the vertices
+        rect = Section(name="Rect", geometry=Geometry(contours=[
+            Contour.from_points([(10, 5), (10, -5), (-10, -5), (-10, 5)])
+        ]))
+        stress = Stress(rect, N=1000.0, Mx=1000.0)
+        tau_min = 1000.0 * 5.0 / rect.J
+        self.assertAlmostEqual(stress.min("tau_torsion"), tau_min)
+        self.assertAlmostEqual(stress.min("von_mises"), math.sqrt(5.0**2 + 3 * tau_min**2))
+        self.assertAlmostEqual(stress.max("tau_torsion"), 1000.0 * math.hypot(10.0, 5.0) / rect.J)
+
+    def test_extremes_match_scalar_search(self):
+        from sectiony.library import i
+        section = i(200.0, 100.0, 10.0, 6.0, 8.0)
+        stress = Stress(section, N=1000.0, My=5e5, Mz=2e5, Vy=300.0, Mx=4e4)
+        points = [
+            p for contour in section.geometry.contours
+            for segment in contour.segments for p in segment.discretize(32)
+        ]
+        for stress_type in ("sigma", "tau", "von_mises"):
+            values = [stress.at(y, z, stress_type) for y, z in points]
+            self.assertAlmostEqual(stress.max(stress_type), max(values))
+            self.assertAlmostEqual(stress.min(stress_type), min(values))
+
+    def test_extremes_follow_geometry_edits(self):
+        stress = Stress(self.section, My=1000.0)
+        before = stress.max("sigma_bending")
+        contour = self.section.geometry.contours[0]
+        contour.segments = Contour.from_points([(20, 10), (20, -10), (-20, -10), (-20, 10)]).segments
+        self.assertAlmostEqual(stress.max("sigma_bending"), 2.0 * before)
+
     def test_invalid_stress_type(self):
         stress = Stress(self.section, N=100.0)
         with self.assertRaises(ValueError):